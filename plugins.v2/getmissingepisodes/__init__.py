@@ -1,10 +1,15 @@
+from collections import OrderedDict
 from pathlib import Path
-from threading import Event, Lock
+from threading import Event, Lock, Thread, Timer
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 import datetime
-import pytz
+import time
+from zoneinfo import ZoneInfo
 from enum import Enum
+from functools import cache
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, TypedDict
 
 from app.chain.tmdb import TmdbChain
@@ -79,6 +84,173 @@ class TvNoExistInfo(TypedDict):
 
 
 default_poster_path = "/assets/no-image-CweBJ8Ee.jpeg"
+# 海报懒加载时的占位图
+LAZY_SRC_PLACEHOLDER = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAKAAAADwCAYAAACHQW/aAAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAAIMJJREFUeJztnXmUVNWdx605J3Myc+Zk9I85OScnC8S4B0WJRlywQdDGsBTtkri3Go2i9AI0O1TRQDdLLyoigoZWEVFRcckybvTMGGM0BiY60Rihih2apQposLur4d25+73vVXXTr+q+qve6f99zfuftRfWtD7/f7953l1NOAYFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAjkc21aj07d9HvUD2+JnVro7wPqA/rsHVT08Suo6b+aUPKtpQj9rhGh3zYg9PtHEHr3CRT/w2rU9OE6VFTo7wnqZSLg/eE51PxaLUJrpnRvr85D6L2VKPb+agARlKM2NaN+n7yGml/vAXhOI89gEJuam1C/Qv8doIAJg3fqpjdR5O3HUfKFme7h0+2Nxch6bzmKYBAhTwSdXJ++jUpJjpcreLq9MAN7xEUo9tbj6M5C/30gn2qTizwvW1uLQXyzHsXWN0JYBnGRPO+jl9HTv3vYO/Cctm4OQusXoKb1UQCxz8pknpetvTQHWeurUaTQZQHKsz59C4XffxbF10UKA55uz0+lOWLsxZmQH/Z6iTwvm2aVPMG4sWkahOVeJxpuf4Ma33qs8JD1yKpQE4DYS/TZO4XN83KwGEAYYJFw+8e1/sjzcvCEqwpdjiCXIs0qf37N2/a8PFqi0OUJ6qECl+f1zKxClyuoB/rsXVT+3pOBzPMAwCCL5HkfrEGbSBcoH8ACAPYV0Txvfa/J8wDAoIh0ff+LeH02o+BwAIB9STLP6xvgAYB+EX19trpPhFsA0E8iI84+Xo/Wv7mk4BAAgH1JNM97vU/leQCgX0S6wzf/GsVJh00f/Ph+MAAwHyJ53vt9N88DAAslEm43vo6eJgO8ffBj+9EAQC+k53lrA5znPTcFJYkBgAESfX32fHDzvOeqUPOaKlTaVKHG+ZJ9co5eCxiAH69PXfjW0hObfrPkxMZPXu3FwwI2vY0GfvBCoPO8+OpJJ59ug4BI7g0CgK/VHg9hi9eP60DEnrg7hZqfsjZ+uLYXdYSl4fYN1PifSwsOUFZGQuzqKhR1+3evnoKiBkD0FMCXo50hbEgAKOzZiZ3o7WUngj+tyF/fRuXvrQxwnjcVPayHWrdaOxX1wwA/7VcA10U6Q9jSACT22G0ptKbqePz91QEcNrrp9yzPeynAeV5Pwm1PhUHsjz9zU5AAlCDemkIvRY7H/ntVAPJD+vrslWDnec9PQWGvyieL/NBTAF+a3RnC1i2Awp4uS6Hf1R9/tXm5D8OyaFZ5Z3nBAcrO4/E8L5dw60Y8PwwUgDI/rEyhNxbj/NAvIJI8791g53lNJFfLd7n1MD/0FMAXZ3WGsLkCkNjSWzrQ2mnHY+8WcrYvkufR12c1PoAoG69nOM/LViQ/XNN1WPYlgMIevbkDvRI9HnuzsbPIy+9pEwm3f1qHGoPaTYqEW5zn+S6h7iI/jHn5b744EwM4M3sAhT31QAq9Un28yfNp50gl44M1KB7EcJvvPC8bke8m8kP8fRPYKrz8916Y0RnCljOAwhu+OPO4d3MfEvg2rDTWwp9f+HC4LUSel4vy8R/FJIDC1lRhCKMefPeP1gXP8/klz/Or1k7vDGEzCmDjDR1o3ezODUa/6CdvoNKXZhceqB6Dx3qpeBq+eoO8AJDYsjtS1ivzU+bK/93lwQm9fs/z/KS10zCA08wDSOyZ8k4z89p88jIKvzq/8GD1JNwGLc8rtJ6f2hnC5gmAy25PWeuiBppn/vB8Ti/T82E96iYFSpeXABLDFZzGnL/kO8uNd7I04/Egz8tZa6Z0hrB5BmDTQ6mNOX/J3zZ62uU8O8uxmxSIaU0VBrDKOwCf+lUq9zzwzTofACe8HusOP9BA2YNO8R7AJ+9L5f4q8Y3FhQdvDeR5nui5yZ0hbJ4BuPJeAwC+vqiAHi8Ar8+CrEAAWLDOpR7neRUD40WTBsbLpwzc7FkHVL9r9aTOEDbPAFzxSwMArs9zd6t8vD6bfNG2yKQL44hZjGzjUwfG+3n5b/pRqydiACd6COA9BgDMVyP0M5Unko/ffdTzZpWqgfGBBLzJCj40aWCM2QXxpoo+BOKzlZ0hbP4G8JVqb8F7tvIEarjpUHLBdfvyUrutumhz6eSLGHyTNfgmXkAAZDbx/HjwRoJlIa8BfOJuAwC+PNc7+B69rRXNuGynhYHIW4Ny1UXxUuX14hI+ZlswfDFmF8Tik86P+67jqkk9W4EBrPAQwLsMAOjFSkNP3NuG5g7fi6oGbSXmaa9fpyYO3FxKwXN4wEkXaCCev0XapAGx5oqze2dYfgYD+IyHAC43AaDJblgk3NaOOkDBmzxoq1X1k61oyqBtefUyFMALYwo8LQQL71eJwavkAFYOYFYxYEtTbwPxmfJUCJt3AJYaAPDFWWbAq7/xEJr20+0Yvm0YvG3WlJ9sY/sXx/P6ZqNKeMBM8F2wxeb9qA1gVvnjzQTEeMV5X/Wa989Pl6VCZLyvrwHMdZrcFTjczrxiJyLQUY+HwaPw4X1iBsrRlUglxAYegU5YBs9XOWAzgw9bxXlyG688b3Pg80OvAXz8TgMArp2eHXhPje9Ac0e0WFMu3oaEx6N2sWb42EA5uhLLARV8k2x5X0zCJ7xf5Y8VhARA7AH1baDD8tMTMIATvAOQ9IzO+UuSJeVdhduJFloyLoGmXrwdA7bdolsNOuexgXJ0JQFgWu1Xht9YRu+nAMT7ZHsuBvBcvj3vq8Yggtj0UCqEzTsAb+/IHUBXzSo3H7GmD95BIROgiX1qlzBj8G23CKAGytGVqjQPOCkNPhV6JwoINQArhefT4cNWfg7enhO8sNxrAFxxXxuaPWSXDTQC2NSLd1js3A6LAkfOXWIH0kA5uhIBUPd8k7RmF+X5FHgVugc8l3tBHTyyfw6z8nP+gcrP/kes4ox/BKLL2KoHUyFsngH42G0eA9hU1omqr2lBEiru4aZdsoOaOJbnf7qDmn7OQDm6kgDQVgnRAKRbVuPNVPnQwm9G+HTD+eEX/fL997nRqvEYwPEBBJDkeQ03HeaQCaB2WAy+nZYOGtuSazssta+ANFCOrqQqIemh11np0PM+aV3BxwGkx2ex/bIzv7TKzvzKt6/1vAZw6a0eALjivnY0+6rdSAB1MiOAZtoXZqAcXWmiHoIdbX4UPEfFo9JW8XDmfener+wsYl+q7ZkUxFjZmf7LD3/9QCqEzTsAbzEM4LI7j6Lpl+50QLTTYueE59O3jnu1Z6fi6wRiA+XoSuO/+WGp/b2v1uQywNnkogBUlQ+V+xHwKIBnO8LvWRzEM7+UNuGMv6OyM/6+8f5+/gnLgQJwJfZ8BCgCm9MIUDqYdF8eMyBt92v7BsrRle4/5X9KJ3z7rw7Pp8O3JUPo/Sot9JZL455P84A6gBPO4BDi7YQf/R099MMv0IM//KLJDyA+dX8qhM0zAB+92RCATWXH0Zyr9jBoBu9CwuPpQCnwFGwz8L34mrqPeUXbsYFydCUC4P2nfIAe+Oc/oQnf/T/2qu389DY/lQN+ldEDUjtb2Mm9H4FvwukYwP4YwP6fo/H9Po8/8P3PC/pa76lfYQB/5SGAvzAE4KKxCQ7VLivNAw7O4BEJdIPJNv1+BSC5tqtgAAp78FufoAoMDsv/tshmF1XpSK98ZKjx2nNADT4K4I8YgA8S70cA7IcB/AG27/8NzbmsJdYQThUkP3wSA/ik3wEk3o/CMph6P4t4tRncC9LtYA7ZYN3YPfy6vF8+w8Ek+wbK0ZWcAEoQT9uIvdeXWpPLVzT/cza7lHfd7MIB/DLd+53OQi8Nvxy+BzB847/3NzR5QJz9YCWppsZwW798lsWT92EA7/MOwEd+bgDAZXcek+BNV1BZ+lZcY7ZTwsdst8XOiy2/5zK2NVCOrtQVgDQsf+NPqAyHZRZuN6utnvuJsOusfMjc70sJ4QSR93EAifejnu8Hf6Peb/z3cApwzhb7D1eSaswXiCsxgCs9BPDhmwwASPrvEVgITDMv2833d0vw6LFm6h5yvJuZ3FefQ4xAaaAcXak7AG0gYjhsFY9zM3u+srPSPR8BkXo+AuDpygMS70c9IIbvAfz5ZH/hdUcz/Xh5Ccsr78UA3utzAKuH77ckYBiYmQIqARTfn6kdz9QsE6DyM3wKoAzLp/4FlWEPpioevMH5HHvlQ+Z9evjl3m/C6V/Qigex8QRA7v2mXbQdLRnTdrIfMbY4nPLstd6KX6ZC2LwD8EYDAM4espdBczk3AZfjeAY/h7eW2Gf37cHn9li2ZzQzUI6u5AZAYQ/9x/+icgLiOQ7oNCvvoubLQu/nzDB8VRfEsNc7hBqud/FjepQfrrgHA3iPdwA23mAAQAUahghvZ2GgdIDYcdeAMSj3WDP48xxQi4BJnjFQjq6UDYAiLE/4zqfUAzrhcwIo4Tud13qxVWJ4l4xNkpphtj+o1VDSafS1XiAA5IAxyDiIs64Q5wRkezJuxX32+/VzwQHQlh9ib2ZvdE5vdiHwEe9Xga/VjNyLlt7ajhpKjPywxvLDJ+5OhcgSrV4BiL28GQAFLGSrjvdaAqRZeJ9DZumASQC5iev6eQPl6Eq5Aihs/L/j/BBDxt/12mq+tNaLr80fsQs9eV+7u3DbQ6sb17Ex17AcDACv0GFioNnPEY+4F9nP781wzvk55PrewAJI7Z/+iCbgvM4ZeiNDtqHldx0h09R69uNKyyE/XH5XKoTNOwBLjAAoQOLbK/dqkDGgZvNzs6/c64CQbdl5sVUgkuOcv6BLGQWQeMJ/+VgCOGXQFtRU1opWeNi00YXF68Ptrl/rLS/FAJZ6+l0N1IIZPBS82dwETN3ZLOdxF8/k/AVdyjSAD3zjQzRpwFfosTv2oafLaNtXvuFT5hLCYAA4pMUBTYtFzs1JO6/D16Jg4/fazuF9dtwSeAAfHR1HL81JoUduyrvXy2SupsR9/M5UCJvPAcSQMAj3WQrGFoc308+32EGkz9jPy2eGBBfA6gGfodUTksjL7kwA4CnMA86RHq/FmqMd03ND9llqv0V6SNtzjn16fNU+epzzF3SpXAGc/O1P0Kuzk+hZD+fVy9pKUqvclMWyOzpC2PwNoABFwMaAY9BhkDh8+9LAnCMgk8/bnxXbnL+gS2ULYNm/foQeC29Dz09pQ4/83Fdej1pduL25MexuRtllt2MAbw8QgHKfguUATOynWQuK4G2E3xdxXMv5C7pUNgA2XrMFvTSzwy95ntPiS8JtRdmUxbLbMIC3+RxACYzwXmKfQyWuR05yTCx61X5Lh5Ncy/kLupQbAGed8Rl66q4E8rLHSA6WXJJF04uuxzCAj/kdwDkYmmjRfgoP3WKjYBXtQ+KY3EPORYts0FniWXJvRHwGuZcfE8v5C7pUTwCsPO0T9Ot7EsjLtwS5GA63D7sNt5kUCAAVcPslcHR/KAOKwbRPnqcwavfpz4n7xT65N+cv6FLdAfjQNz9Ci4ZsRU/+sg013lh40Jw/JgZvQ2P4qLHuWUtv7Qhh8z+AUQFc0QGLWMThEeU5J3C2Zx0AczNQjq7UFYDzfrIZrbjra7rgsg9gc1os2zyvOy29BQN4i+8BxNAN1UAaqqCTNlS/dsBS18k5cv2Aeka/Z2jhAaz6zqeoYdRB5PEPka0lMHhRE+E2k5bejAG82e8AMoA4ZAc4aGnHHK4DdH/uMGbiHN2X9x6U95HrBsrRlQSAZf/2Z1RXfJAMnCk0ZBl/ONKm5xV4Qo9iAB/1O4AUHgmQZvKcBhTel/A579eu6Z9poBxdqeJbfymddV6cgmeof57RH4zkeV6E20x69BcYwOw7yObPAypwMGzDOHTDBFQHKUxzuzAGKL7v6oPyWL9uoBxdqb6krbTef+ARS+R7fDD+TxjyOAKY8IAHKXgEoOgwBpx+ju0fYNfIMQdN3cfAJfvV7H6r+mr1GQbK0ZXqwxjAwsNmA8/LPK87BQLAaglVwpIwyXM6kAfQ3KszwMmBrNaPxefhrYFydCUfAcibVfI7GF3Xwzd1hDzuPmbAA17NQGEgJiy5HZ5AAs5qaglm+Lw6d5Aei3vl9moFooFydCUfAGjVjUttzFee150evhED6G17pwkPqMMjACNQMhjFsQKUn9fBHJ6wg0jvSdL7DJSjKxUSwAYabnN7fWZSwQDQBg8FTPNoSct2XbN59mcobPPk+aQ1j3+GgXJ0pYIAWNJhNYxrbyxEntedGm/oCHnc8J47gAIaAY6ERx6r605T1/AzI5LpcGIzUI6ulGcArcbrC5vndadgAIjB0SES2/lkX1zj+xTOEYcs9Qx7rlp7Rj43gp0zUI6ulC8AG67viDXeUPg8rzvh7xjyYsioYQ+oA3fIDh/Zv+aQ3NdNQKfb/PT7el0zTENJR6K+pC2a778rG+HvGvK4Md6QB+SgzRdbCt0hAZg1/xo7YAJWJ3Ds2SQzfs5AObqShwD6Ms/rTjg3DXncKJ87gBgaDhjbCgCV8dB6jW6HLQmsgJEey8+wxL0GytGVPAAwr6/PTAp/95CX0cCQB6TwMIAEWMro8YJr7efEMdkuuPYwv++wZb+PHRsoR1cyDGCsLtwRzvffYEqBAFCAIkzBc5jtX4uhdIDFjtk9aTBeK86zawbK0ZUMAViw12cmFQgABSgCIAWR8mIKqkPIvrWfs0MZSA/Iu0n5s1nFraoGbr3Q9wDWFNtBEsc1xUcyeDR2TO+h9x2xXZPPs8+g1wyUoytlCWBg87zuVDUoflcAAGSg1Yw8YgOPwFUjIcMmwCrWIct0Xrsfbw2UoytlAWDeu0nlQ1WDtoamDNra7HsACTA1BJpiBo2ASG4xmATKmmIGJz3WzvHnUa1+Xl4/4mcP2CvyvK40ZVB8HFmx3vcASqCotVLgKEwMOAxXq2UDT4Fmccgs5/PUm/JnDZSlK/UAwIJ3k/JaUwfG+2MPGA8EgLUjW+3gUbjIcavlhK7Wtt8qz9WmAdyKxOcaKE9XInlcd+D1tjzPqaqB8QunXLItTletDwSA12FYhBF4rmPgMLAEiPjYed9Isa+ek+e0ewyUqWvVj0ttIIUjCqneZ92kvFDFwPipUy/e3khWKGWr2W8nAFoBAPAohWuhBpjYX/izo/wcvmekumYDUkJH77EW0nuOys8yULZZiYTiJSWpVQ3h9vLemucJzfjp7nIMXnIaXSKXr25PALw4IB6QAjfyKIOHQsehxPsLOVwKxnQ4F2YAd2GBAewLmnbpjqLpg3dusi8gvl1uMYT+94AUFgdo6hwBUZmCU92X9oy0Y/S8gXIGOTTt0j39pw/e3SyWRiOLQ/IV65kHFBYcAI/1AKjMkNnul/vH5NZAeYO4Korip864bE8EW0IuIGlbq5ktIK5D6HsAF486mlw0SkGj7+tgqmt2DyfOMzumHbN9A+UOwsLQlc68HIPH1+cT6/TJpXZtq9jvCA6Ai352LL6QQ0egYXbUsVXnJYijxP1sP/0zmBko+z6r2VfuDc26YsfQWVfsaVYrU+1OW9WUwbfLUl5QhWMvASSL6eT8R2JomhRMXdnXFvNo+L7R3d13DMn7AMCcFCna0x8D2ESW0JDrr1zuAPAyukazpS8YLr3gJRRCbz2gyzmrM6p2VGuRhGy0Am7x6K8ROaZbBpOl7dvuEYDq95MtMQO/RZ9SpGjraXOGtERmD9mfECsP2Feh0haJ1NZ1FmFYVEiEeRl+jTTqN4aTpy4ecywhYFoyRoHHYBKgEUDJPgMt/R51zKzNIudz/0n6hqJF+0ORov1DI1fti7PJ4rXlMK5oUUuo8VVI2aqku5BeE57uCMPYC3pZC44Z++MxWBUEGGYMOAERP6fAGpPBtOtkkWb9XmNfspcqOuxgCMM3FFuzmq9bXxZDrkRlD8OXa+s3D9aaYy7daem1Yq+8X0M4dYfRglgyum0D8X4UoDTAMIR8n13nUNJz5BoD1fksOTb6JXuZokXJ0zCAjWpubm2Sd9v6LcwL8kUg1cqldJ3m3Tj88sqIDMM7vQ3BJR2vGi+M2nBbPwxSjEAjjIGnwFoyVl3r6pwENI8A1rOu56F8/FsmNBd7vXlXH6yIDj2Q1GeljRRpqw5oa62Itfj0RSX52sxWWigeTCsiloDQi9DrWU8iAiEGKkahomC1W2qfgUj2FZRt+nUk98eqa558UU0N1x+/ExdKsp6tKFnpZxDnDU+EosOTQzGAcfv8imp6Y7XmStoKVbZQzNZz3q1qxQ4vSELwdGwmwy6ZdMnzbmykUoLBWYVNwlUXbudgMSDrxrYrKMdqkEpQ2y3xjKdf9hTq/eKOgorj/KS0viTlKxCjxcn+GMBmNR2ec6ZZNbe2bQ0WfXm0KxV8apV6tki48ILTB7P2QcMekNR4I3nt1FEXPhZm3rD9BIGJ2th2DmO7DU4GpIJTHJNrXn/PrvMUutBzf6///ZOJ5HnVw5NR25w7av5FO4i25S8cFRL70rj2JhmeC84YrDdO76IQ5uz1wu0b8HcqKlgBLibdmsLtMR00tt9hyX2H1Yc7qBUUQG4NJZ2k2/1pXn8Pp+aPOBRaMCJZMX9EMikmbhIAahOA0plnbXN0a17Qtg6ftoqp3iwzU2ucVm9IVCjO2uONbUtUDztYnu9yyyiSG2KYGrFlBK4u3GGlH/sDQD0s1+UhP6y59khoXnFyKAawWcwsoebTSdgn8ZQz0Gr5oPCAjmXQpBfUvKEMxdQDklqx3ji9m74jdgsfTb1wuCUdXL0uK9eilZRwx6p6Dhz5wgI46vW0P0TA6PV3clO4GMBNJCx7lR/W4jwPA7iejAZUs0wcts065pxRVs7BLdZbGaoW+mHw8aYZWyim6zPL5hibJ7xceUFsbioh1sKRrTjc7unnRdkYFR34g8Nyver2zi1lMfjYeSMvq0/2XbIJMYbzQ5Ln1RS3RmuKjyTYcFQxZclhOd+OPq2dNiEom42We0K5JAYD0IrY1ubjy+nawrB6TTeTe0DlBXfTvLAn4C0a87UnKzV5rrpwqryezZ+S9j+NnMvHeNscEmxWW84hLNeObA3VjDwyrnbkkXgNH0koxkSr2SXY/DocQAWhnPbYXhmR3rBItQ2SHFBCyBcVZyvWO96QiDDMa8TkmW4jAs7zlow+6o88L1uRdiHs6Zq4N1RW0hHNx7+fA4ASRPy/f6ibsLxo9NFQbXHrUAxgsxjExUYSsrHQC4rts0U4c8F5eggWIPKlL9TSZ3y1Kr5SKQ3F2or0pF1w1pXCC+61WLvgHvF6jnpB8vld5XmLxxwN1FRzJxUBsWFcx1gSnvP5hxkA0FVYjo5NnoYBbBS9wcUYGQkhH5Bvh08BKKaz0+ff1pa/cKxapXlB3jid3lFBC8OsTdAStWLSd9MZbkmzyuIRSWMrcvZ5GQOQG2u2aevfMC4VwjltaMnottDi0V+HGsPJ0xaPaosuGnUs4RxHU8uHseozQrApSrRZxhSEdGLPtBqxqhnb4GO54H5bw7RsnFYQUk/IG6apFyTndfCWjG0PZp7nd5kGUII4LrUJA9iMAWzGAMYX8V5CtPe3GI7gHC3IB+uzeXb4HDlOTzjCHopx7VgLxwftYVhUSHgYjtiaZFocbYPqrQgx8p+A/y2JRWOORch4kkL/Vr1SXgEo8yWt44Xo96iPfekKQEcuKOZYlBUSsSJBtV4hGZYWikVlRLYPinbB2ZnDMW2SIZ/FvF6b5yty9nnlDUDR+5sBaDkHbOmzRKi5cbTZw7gXFBN62ioktld0bMk0tUqpvhD4Pp4PkgrJPu39sPCCe1FkyL4T2Fv3+ilIfKN8ekDVA1wf/6JGCJJ8UM2p02rVFKv5FvXZZJ1hOPMbEseyuVrboPKCLbxdkIJIrsUw9GY7ioK6l9cA1o21A+gclKXDJ42H4gUODyhmjlUrEYjlLvSVp+xtg1FnuyB9MyI6rrLGaewNE9gLzoFwWwB57gGdnXD5GBg1UlB4wGNp05fUFGuTfBY7vGDa2xFtWTSty5ZakV70krF1XD0RubLl1eilAXh91luVXwDFOBmVDwr4Ms2f00WFRJsQXlsIaLjDC9oqI3o+eICEWuIRyXvbokKXf5+X5yFY7/+oDcKiowS1oayiVpzeOH1Enzfb5gXlylTXKAD5iqSZOq2SNyMYvAMJDGCwX5/1JuUDQNUDvN2SA7K0fJC1DWpz69jmUmy1TWlcI2vEh7U1WLTlzxxhOKoqJInIsP2RKLTn+Ut5ATDcroYlyHEx2phpW43YGYbFO2J99YAjlj0XzNBdS67bjMPv1QeC0U2qL8p7AHln27HttnyQDry3zxyBFuoTO13naBss1l7T6XmgY6FILRSfmDs8sbGg3eFBJ1e+PKB9xN/XcuipygfZFCXpNeKj9rm2BYDFmZpl+LK5w5OJ+cOTvXpK4V4jrwHU80A5KMsxOF/Mj2N7O6LNGCvm3FYdFdQCQI53xMQLNkaLkpDnBUX1bEywlyFYDjtgtWFWI1azQTAPmCkXlD1mRvI5tkdqPWWK9eaYQ+Rd8YZocbJfocsT5FIYjofz5gXDjmGp2lQk+huStPfEI7XJ3OUaK7RCcgLbFhxyiwpdjqAsRTrCYkBi3sHHxrnUh9PzQdu8OVouqFdG5Jza19kAxGH5cAJDGCl0+YEMiA4LCLc11acNkvIuH7RNSaJmBLPEqzr7vNu2dkFSKWmAPK8Xio1PsS1SYyoPtNLDsH1OHJkPau+JVX9B+naE5IEbFoxsvarQ5QTyWHy9OENhOWUpENXMD/qbET0cs4k8xfzabI7t2p8d24K9XmBXXgdlKbIaJgYnYTL8ZsoF9Vqx/nYE54KJ2lGt0WgRdJPqszKbH6bsoVhMyjSmXfOCIhdsW1Vb3HtX5AS5lFZbdgmiCsENJSktFHdYaiYw2SRj0ZlmR0F3eFAXMpUf1oVVWKZT2I1tT9T1wpXXQR6IdF3n+aELb6hVRmyVko6D2CJR6A4Pcque5IeqCabDcpzr9Suvg/IkMoSx+/ZD6f343DcpGPYIMq9GOv9hW5TDmFDAkTDbvoGEWgAPlDeRXBGGOoJAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgUFP0/6pF8BCysaRUAAAAASUVORK5CYII="
+
+# 媒体详情链接中的电视剧类型参数
+TV_TYPE_VALUE = MediaType.TV.value
+# 渲染和检查过程中频繁比较的检查状态值
+HISTORY_STATUS_UNKNOW = HistoryStatus.UNKNOW.value
+HISTORY_STATUS_ALL_EXIST = HistoryStatus.ALL_EXIST.value
+HISTORY_STATUS_ADDED_RSS = HistoryStatus.ADDED_RSS.value
+HISTORY_STATUS_NO_EXIST = HistoryStatus.NO_EXIST.value
+HISTORY_STATUS_FAILED = HistoryStatus.FAILED.value
+
+# 剧集状态中文映射
+STATUS_MAP = {
+    'Returning Series': '播出中',
+    'Planned': '计划中',
+    'In Production': '制作中',
+    'Ended': '已完结',
+    'Canceled': '已取消',
+    'Cancelled': '已取消',
+    'Pilot': '试播集',
+    'Released': '已发布',
+    'Post Production': '后期制作',
+    'Returning': '回归中',
+    'Rumored': '传言中',
+    'In Development': '开发中',
+    'Unknown': '未知状态',
+    '': '未知状态',
+}
+STATUS_MAP_LOWER = {k.casefold(): v for k, v in STATUS_MAP.items()}
+
+# TMDB剧集持久化缓存：已完结/已取消的剧集缓存较长，其余（播出中等）缓存较短
+TMDB_CACHE_FINISHED_STATUSES = ("Ended", "Canceled", "Cancelled")
+TMDB_CACHE_TTL_AIRING = datetime.timedelta(hours=24)
+TMDB_CACHE_TTL_FINISHED = datetime.timedelta(days=30)
+# 并发检测线程数上限，避免同时向媒体服务器和TMDB发起过多请求
+MAX_WORKERS_LIMIT = 16
+# 检查记录变更后延迟写入存储的秒数，合并短时间内的多次变更
+HISTORY_FLUSH_DELAY = 2
+# 配置页面媒体库列表缓存秒数
+FORM_LIBRARIES_CACHE_TTL = 60
+# 详情页面剧集卡片中不随记录变化的属性，只读共享
+CARD_PROPS = {
+    "variant": "tonal",
+    "style": "width: 320px; min-height: 240px;",
+    "class": "history-card",
+}
+CARD_BODY_PROPS = {"class": "flex flex-row"}
+CARD_POSTER_PROPS = {
+    "height": 240,
+    "width": 160,
+    "aspect-ratio": "2/3",
+    "class": "object-cover shadow ring-gray-500 max-w-40",
+    "cover": True,
+    "transition": True,
+    "lazy-src": LAZY_SRC_PLACEHOLDER,
+}
+CARD_INFO_PROPS = {
+    "class": "flex flex-col",
+    "style": "width: 160px;",
+}
+CARD_TITLE_PROPS = {
+    "class": "pt-6 pl-4 pr-4 text-lg",
+    "style": "word-break: break-word; white-space: normal; line-height: 1.2;",
+}
+CARD_LINK_PROPS = {
+    "target": "_blank",
+    "style": "text-decoration: none; color: inherit;",
+}
+CARD_ACTIONS_PROPS = {
+    "class": "d-flex mt-auto",
+    "style": "width: 100%; display: flex;",
+    "variant": "tonal",
+    "rounded": "0",
+}
+# 详情页面剧集卡片中信息行的属性，只读共享
+CARD_TEXT_FIRST_ROW_PROPS = {"class": "pa-0 pl-4 pr-4 pb-1 whitespace-nowrap"}
+CARD_TEXT_ROW_PROPS = {"class": "pa-0 pl-4 pr-4 py-1 whitespace-nowrap"}
+# 详情页面剧集卡片展示的剧集信息字段及默认值，顺序与卡片构建时的解包一致
+CARD_TV_FIELDS = (
+    ("title", "未知"),
+    ("year", "未知"),
+    ("tmdbid", 0),
+    ("poster_path", default_poster_path),
+    ("vote_average", 0.0),
+    ("last_air_date", "未知"),
+    ("status_cn", "未知状态"),
+)
+# 详情页面剧集列表外层中不随数据变化的部分，只读共享
+HISTORYS_TITLE_PROPS = {"class": "pt-8 pb-2 px-0 text-base whitespace-nowrap text-center"}
+HISTORYS_POSTS_PROPS = {
+    "class": "flex flex-row flex-wrap gap-4 items-start justify-center",
+    "style": "margin: 0 auto; max-width: 100%;",
+}
+HISTORYS_EMPTY_CONTENT = {
+    "component": "div",
+    "text": "暂无数据",
+    "props": {
+        "class": "text-start",
+    },
+}
+# 详情页面列表排序键，对应 HistoryEntry 中的位置
+SORT_KEY_LAST_CHECK = itemgetter(2)
+SORT_KEY_LAST_STATUS_CHANGE = itemgetter(3)
+# 详情页面统计卡片：(标题, 图标, 对应的历史数据类型)
+STAT_CARDS = (
+    ("最近处理", Icons.RECENT, HistoryDataType.LATEST.value),
+    ("总处理", Icons.STATISTICS, HistoryDataType.ALL.value),
+    ("存在缺失", Icons.WARNING, HistoryDataType.NO_EXIST.value),
+    ("已有季缺失", Icons.TARGET, HistoryDataType.NOT_ALL_NO_EXIST.value),
+    ("未识别", Icons.BUG_REMOVE, HistoryDataType.FAILED.value),
+    ("全部存在", Icons.GLASSES, HistoryDataType.ALL_EXIST.value),
+    ("已订阅", Icons.ADD_SCHEDULE, HistoryDataType.ADDED_RSS.value),
+    ("已跳过", Icons.SKIP, HistoryDataType.SKIPPED.value),
+    ("已完结", Icons.FINISHED, HistoryDataType.FINISHED.value),
+)
+# 统计卡片点击切换历史数据类型的接口，参数按卡片填充
+STAT_CARD_CLICK_TEMPLATE = {
+    "api": "plugin/GetMissingEpisodes/set_history_type",
+    "method": "get",
+}
+# 详情页面剧集卡片缓存数量
+POST_CACHE_SIZE = 512
+# 详情页面操作按钮统一样式
+ACTION_BUTTON_STYLE = "height: 100%; width: 100%; flex: 1;"
+# 详情页面操作按钮模板：接口名 -> (按钮属性, 按钮文字)，按钮属性为只读共享
+ACTION_BUTTONS = {
+    "add_subscribe_history": (
+        {"class": "text-primary", "variant": "tonal", "style": ACTION_BUTTON_STYLE},
+        "订阅缺失",
+    ),
+    "set_all_exist_history": (
+        {"class": "text-success", "variant": "tonal", "style": ACTION_BUTTON_STYLE},
+        "标记存在",
+    ),
+    "toggle_skip_history": (
+        {"class": "text-warning", "variant": "tonal", "style": ACTION_BUTTON_STYLE},
+        "跳过",
+    ),
+    "delete_history": (
+        {"class": "text-error", "variant": "tonal", "style": ACTION_BUTTON_STYLE},
+        "删除记录",
+    ),
+}
+# 各检查状态下显示的操作按钮
+ACTION_NAMES_BY_STATUS = {
+    HISTORY_STATUS_NO_EXIST: (
+        "delete_history",
+        "set_all_exist_history",
+        "add_subscribe_history",
+        "toggle_skip_history",
+    ),
+    HISTORY_STATUS_ADDED_RSS: (
+        "delete_history",
+        "set_all_exist_history",
+        "toggle_skip_history",
+    ),
+    HISTORY_STATUS_ALL_EXIST: (
+        "delete_history",
+        "toggle_skip_history",
+    ),
+    HISTORY_STATUS_FAILED: (
+        "delete_history",
+        "toggle_skip_history",
+    ),
+}
+DEFAULT_ACTION_NAMES = ("delete_history", "toggle_skip_history")
 
 
 def create_tv_no_exist_info(
@@ -93,7 +265,7 @@ def create_tv_no_exist_info(
     status: str = "Unknown",
     status_cn: str = "未知",
 ) -> TvNoExistInfo:
-    logger.debug(f"season_episode_no_exist_info: {season_episode_no_exist_info}")
+    logger.debug("season_episode_no_exist_info: %s", season_episode_no_exist_info)
     return TvNoExistInfo(
         title=title,
         year=year,
@@ -108,6 +280,11 @@ def create_tv_no_exist_info(
     )
 
 
+def is_iso_date_str(value: str) -> bool:
+    """判断是否为 YYYY-MM-DD 格式的日期字符串"""
+    return len(value) == 10 and value[4] == "-" and value[7] == "-"
+
+
 class HistoryDetail(TypedDict, total=False):
     exist_status: Optional[str]
     tv_no_exist_info: Optional[TvNoExistInfo]
@@ -119,8 +296,8 @@ class HistoryDetail(TypedDict, total=False):
     ignored_seasons: Optional[List[int]]          # 新增：被手动标记存在的季号列表
 
 
-class ExtendedHistoryDetail(HistoryDetail):
-    unique: Optional[str]
+# 详情页面使用的 (记录键, 检查记录, 检查时间排序键, 状态变更时间排序键)，不复制记录本身
+HistoryEntry = tuple[str, HistoryDetail, str, str]
 
 
 class History(TypedDict):
@@ -171,12 +348,43 @@ class SVGPaths:
         }
         return paths.get(icon_name, [])
 
+    @staticmethod
+    def get_svg_content(icon_name: Icons, color: str) -> dict[str, Any]:
+        """生成指定图标和颜色的SVG组件"""
+        return {
+            "component": "svg",
+            "props": {
+                "class": "icon",
+                "viewBox": "0 0 1024 1024",
+                "width": "40",
+                "height": "40",
+            },
+            "content": [
+                {
+                    "component": "path",
+                    "props": {"fill": color, "d": d},
+                }
+                for d in SVGPaths.get_paths(icon_name)
+            ],
+        }
+
+
+# 统计卡片图标颜色：未选中、选中
+ICON_COLOR = "#8a8a8a"
+ICON_SELECTED_COLOR = "#1976d2"
+# 统计卡片图标在加载时生成一次，按 (图标, 颜色) 只读共享
+ICON_SVG_CACHE = {
+    (icon_name, color): SVGPaths.get_svg_content(icon_name, color)
+    for icon_name in Icons
+    for color in (ICON_COLOR, ICON_SELECTED_COLOR)
+}
+
 
 class GetMissingEpisodes(_PluginBase):
     plugin_name = "剧集补全&新季追更"
     plugin_desc = "检测指定剧集库，对有新季或存在集缺失的剧集自动订阅补全"
     plugin_icon = "https://raw.githubusercontent.com/andyxu8023/MoviePilot-Plugins/main/icons/EpisodeNoExist.png"
-    plugin_version = "2.2.7"  # 更新版本号
+    plugin_version = "2.2.8"  # 更新版本号
     plugin_author = "boeto，左岸"
     author_url = "https://github.com/andyxu8023"
     plugin_config_prefix = "getmissingepisodes_"
@@ -195,6 +403,7 @@ class GetMissingEpisodes(_PluginBase):
     _msHelper: MediaServerHelper
     _plugin_id = "GetMissingEpisodes"
     _scheduler = None
+    _tz = None
 
     # 配置属性
     _enabled: bool = False
@@ -206,11 +415,33 @@ class GetMissingEpisodes(_PluginBase):
     _only_aired: bool = True
     _no_exist_action: str = NoExistAction.ONLY_HISTORY.value
     _save_path_replaces: List[str] = []
+    _save_path_rules: List[tuple[str, str]] = []
     _whitelist_librarys: List[str] = []
     _whitelist_media_servers: List[str] = []
+    _whitelist_librarys_set: frozenset = frozenset()
+    _whitelist_media_servers_set: frozenset = frozenset()
+    # 配置页面媒体库列表缓存 (获取时间, 媒体服务器, 媒体库名称列表)
+    _form_libraries_cache: Optional[tuple[float, tuple, List[str]]] = None
+    _form_libraries_refreshing: bool = False
+    # 详情页面剧集卡片缓存，记录未变化时直接复用
+    _post_cache: "OrderedDict[tuple, dict]" = OrderedDict()
     _current_history_type: str = HistoryDataType.LATEST.value
     _auto_skip_finished: bool = False
     _include_s00_season: bool = False
+    _max_workers: int = 8
+
+    # 单次扫描内的TMDB剧集缓存 {(tmdbid, season): episodes}
+    _episodes_cache: Dict[tuple, list] = {}
+    # 单次扫描内的TMDB媒体识别缓存 {tmdbid: tmdbinfo}，识别失败记为False
+    _recognize_cache: Dict[int, Any] = {}
+    # 跨扫描持久化的TMDB剧集缓存 {"tmdbid_season": {"episodes", "fetched_at", "status"}}
+    _tmdb_cache: Dict[str, Any] = {}
+    # 检查记录的内存副本，变更后延迟写入存储
+    _history: Optional[Dict[str, Any]] = None
+    _history_dirty: bool = False
+    # 待写入存储的检查记录对象
+    _history_pending: Optional[Dict[str, Any]] = None
+    _history_flush_timer: Optional[Timer] = None
 
     def init_plugin(self, config: dict[str, Any] | None = None):
         """初始化插件"""
@@ -221,6 +452,7 @@ class GetMissingEpisodes(_PluginBase):
             self._tmdbChain = TmdbChain()
             self._msChain = MediaServerChain()
             self._msHelper = MediaServerHelper()
+            self._tz = ZoneInfo(settings.TZ)
 
             if config:
                 self._load_config(config)
@@ -230,6 +462,10 @@ class GetMissingEpisodes(_PluginBase):
             if saved_type:
                 self._current_history_type = saved_type
 
+            # 读取TMDB剧集缓存
+            self._tmdb_cache = self.get_data("tmdb_cache") or {}
+            self._post_cache = OrderedDict()
+
             # 停止现有任务
             self.stop_service()
 
@@ -253,12 +489,19 @@ class GetMissingEpisodes(_PluginBase):
         self._auto_skip_finished = config.get("auto_skip_finished", False)
         self._include_s00_season = config.get("include_s00_season", False)
 
+        # 处理并发线程数
+        try:
+            self._max_workers = min(MAX_WORKERS_LIMIT, max(1, int(config.get("max_workers") or 8)))
+        except (TypeError, ValueError):
+            self._max_workers = 8
+
         # 处理保存路径替换
         _save_path_replaces = config.get("save_path_replaces", "")
         if _save_path_replaces and isinstance(_save_path_replaces, str):
             self._save_path_replaces = [line.strip() for line in _save_path_replaces.split("\n") if line.strip()]
         else:
             self._save_path_replaces = []
+        self._save_path_rules = self._parse_save_path_rules(self._save_path_replaces)
 
         # 处理媒体库白名单
         self._whitelist_librarys = self._parse_list_config(
@@ -272,6 +515,21 @@ class GetMissingEpisodes(_PluginBase):
             default=[]
         )
 
+        # 白名单集合，用于扫描时快速判断
+        self._whitelist_librarys_set = frozenset(self._whitelist_librarys)
+        self._whitelist_media_servers_set = frozenset(self._whitelist_media_servers)
+
+    @staticmethod
+    def _parse_save_path_rules(save_path_replaces: List[str]) -> List[tuple[str, str]]:
+        """解析下载路径替换规则为 (媒体库路径, 下载路径) 列表"""
+        rules = []
+        for save_path_replace in save_path_replaces:
+            replace_list = [part.strip() for part in save_path_replace.split(":") if part.strip()]
+            if len(replace_list) < 2:
+                continue
+            rules.append((replace_list[0], replace_list[1]))
+        return rules
+
     def _parse_list_config(self, config_value: Any, default: List[str] = None) -> List[str]:
         """解析列表配置，支持字符串和列表格式"""
         if default is None:
@@ -295,7 +553,7 @@ class GetMissingEpisodes(_PluginBase):
             self._scheduler.add_job(
                 func=self.__refresh,
                 trigger="date",
-                run_date=datetime.datetime.now(tz=pytz.timezone(settings.TZ)) + datetime.timedelta(seconds=3),
+                run_date=datetime.datetime.now(tz=self._tz) + datetime.timedelta(seconds=3),
             )
 
             if self._scheduler.get_jobs():
@@ -395,17 +653,26 @@ class GetMissingEpisodes(_PluginBase):
     def __get_mediaserver_tv_info(self) -> None:
         """获取媒体库电视剧数据"""
         logger.info("开始获取媒体库电视剧数据 ...")
+
+        # 每次扫描重置TMDB剧集及媒体识别缓存
+        self._episodes_cache = {}
+        self._recognize_cache = {}
         
         # 清理检查记录
         if self._clearflag:
             logger.info("清理检查记录")
-            self.save_data("history", "")
+            with self._lock:
+                self._history = None
+                self._history_dirty = False
+                self._history_pending = None
+                self.save_data("history", "")
             self._clearflag = False
             history = None
         else:
-            history = self.get_data("history")
+            history = self.__get_history()
 
         history_data: Dict[str, Any] = history if history else {"details": {}}
+        self._history = history_data
         
         # 新增：记录本次扫描到的所有电视剧唯一标识
         seen_flags = set()
@@ -417,7 +684,7 @@ class GetMissingEpisodes(_PluginBase):
             tv_no_exist_info: TvNoExistInfo | Dict[str, Any] | None = None,
         ):
             with self._lock:
-                current_time = datetime.datetime.now(tz=pytz.timezone(settings.TZ))
+                current_time = datetime.datetime.now(tz=self._tz)
                 current_time_str = current_time.strftime("%Y-%m-%d %H:%M:%S")
 
                 # 检查是否已有记录
@@ -475,7 +742,83 @@ class GetMissingEpisodes(_PluginBase):
                     }
                 
                 logger.debug(f"添加/更新检查记录: {item_unique_flag}, 状态: {exist_status.value}")
-                self.save_data("history", history_data)
+                self.__schedule_history_flush(history_data)
+
+        # 获取单个电视剧的缺失信息并记录，在线程池中执行
+        def __process_item(mediaserver: str, item: Any, item_title: str, item_unique_flag: str,
+                           item_type: str, ignored_seasons: List[int]):
+            # 获取季信息（已有集转换为集合，便于后续查找缺失集）
+            seasoninfo = {}
+            if item_type == MediaType.TV.value and item.tmdbid:
+                try:
+                    espisodes_info = self._msChain.episodes(mediaserver, item.item_id) or []
+                    for episode_info in espisodes_info:
+                        seasoninfo[episode_info.season] = set(episode_info.episodes or [])
+                except Exception as e:
+                    logger.error(f"获取剧集信息失败: {str(e)}")
+
+            # 准备数据
+            item_dict = item.dict()
+            item_dict["seasoninfo"] = seasoninfo
+            item_dict["item_type"] = item_type
+            logger.debug("获到媒体库【%s】数据：%s", item_title, item_dict)
+
+            # 获取缺失集数信息，传入忽略季列表
+            is_add_subscribe_success, tv_no_exist_info = self.__get_item_no_exist_info(
+                item_dict, ignored_seasons
+            )
+
+            # 处理结果
+            if is_add_subscribe_success and tv_no_exist_info:
+                if not tv_no_exist_info.get("season_episode_no_exist_info"):
+                    logger.info(f"【{item_title}】所有季集均已存在/订阅")
+                    __append_history(
+                        item_unique_flag=item_unique_flag,
+                        exist_status=HistoryStatus.ALL_EXIST,
+                        tv_no_exist_info=tv_no_exist_info,
+                    )
+                else:
+                    logger.info(f"【{item_title}】缺失集数信息：{tv_no_exist_info}")
+
+                    if self._no_exist_action == NoExistAction.ADD_SUBSCRIBE.value:
+                        logger.info("开始订阅缺失集数")
+                        is_add_subscribe_success = self.__add_subscribe_by_tv_no_exist_info(
+                            tv_no_exist_info, item_unique_flag
+                        )
+                        if is_add_subscribe_success:
+                            __append_history(
+                                item_unique_flag=item_unique_flag,
+                                exist_status=HistoryStatus.ADDED_RSS,
+                                tv_no_exist_info=tv_no_exist_info,
+                            )
+                        else:
+                            logger.warning(f"订阅【{item_title}】失败, 仅记录缺失集数")
+                            __append_history(
+                                item_unique_flag=item_unique_flag,
+                                exist_status=HistoryStatus.NO_EXIST,
+                                tv_no_exist_info=tv_no_exist_info,
+                            )
+                    elif self._no_exist_action == NoExistAction.SET_ALL_EXIST.value:
+                        logger.debug("将缺失季集标记为存在")
+                        __append_history(
+                            item_unique_flag=item_unique_flag,
+                            exist_status=HistoryStatus.ALL_EXIST,
+                            tv_no_exist_info=tv_no_exist_info,
+                        )
+                    else:
+                        logger.debug("仅记录缺失集数")
+                        __append_history(
+                            item_unique_flag=item_unique_flag,
+                            exist_status=HistoryStatus.NO_EXIST,
+                            tv_no_exist_info=tv_no_exist_info,
+                        )
+            else:
+                logger.warning(f"【{item_title}】获取缺失集数信息失败")
+                __append_history(
+                    item_unique_flag=item_unique_flag,
+                    exist_status=HistoryStatus.FAILED,
+                    tv_no_exist_info=tv_no_exist_info,
+                )
 
         mediaservers = self.__get_mediaservers()
         if not mediaservers:
@@ -494,7 +837,7 @@ class GetMissingEpisodes(_PluginBase):
                 continue
                 
             # 检查媒体服务器白名单
-            if self._whitelist_media_servers and mediaserver not in self._whitelist_media_servers:
+            if self._whitelist_media_servers_set and mediaserver not in self._whitelist_media_servers_set:
                 logger.info(f"【{mediaserver}】不在媒体服务器名称白名单内, 跳过")
                 continue
                 
@@ -509,7 +852,7 @@ class GetMissingEpisodes(_PluginBase):
 
             for library in librarys:
                 # 检查媒体库白名单
-                if self._whitelist_librarys and library.name not in self._whitelist_librarys:
+                if self._whitelist_librarys_set and library.name not in self._whitelist_librarys_set:
                     logger.debug(f"媒体库 {library.name} 不在白名单内，跳过")
                     continue
                     
@@ -529,113 +872,56 @@ class GetMissingEpisodes(_PluginBase):
                     logger.debug("未获取到媒体库items信息, 跳过获取缺失集数")
                     continue
 
-                for item in library_items:
-                    item_count += 1
+                # 各电视剧的网络请求互不依赖，并发处理
+                with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                    futures = {}
+                    for item in library_items:
+                        item_count += 1
 
-                    if not item or not item.item_id:
-                        logger.debug("未获取到Item媒体信息或Item ID, 跳过获取缺失集数")
-                        continue
+                        if not item or not item.item_id:
+                            logger.debug("未获取到Item媒体信息或Item ID, 跳过获取缺失集数")
+                            continue
 
-                    item_title = item.title or item.original_title or f"ItemID: {item.item_id}"
-                    item_unique_flag = f"{mediaserver}_{item.library}_{item.item_id}_{item_title}"
+                        item_title = item.title or item.original_title or f"ItemID: {item.item_id}"
+                        item_unique_flag = f"{mediaserver}_{item.library}_{item.item_id}_{item_title}"
                     
-                    # 新增：将本次扫描到的有效电视剧加入集合
-                    seen_flags.add(item_unique_flag)
+                        # 新增：将本次扫描到的有效电视剧加入集合
+                        seen_flags.add(item_unique_flag)
 
-                    # 检查是否被标记为跳过
-                    if item_unique_flag in details and details[item_unique_flag].get("skip", False):
-                        logger.info(f"【{item_title}】已被标记为跳过, 跳过检测")
-                        continue
+                        # 检查是否被标记为跳过
+                        if item_unique_flag in details and details[item_unique_flag].get("skip", False):
+                            logger.info(f"【{item_title}】已被标记为跳过, 跳过检测")
+                            continue
 
-                    # 获取该记录的忽略季列表
-                    ignored_seasons = []
-                    if item_unique_flag in details:
-                        ignored_seasons = details[item_unique_flag].get("ignored_seasons", [])
+                        # 获取该记录的忽略季列表
+                        ignored_seasons = []
+                        if item_unique_flag in details:
+                            ignored_seasons = details[item_unique_flag].get("ignored_seasons", [])
 
-                    logger.info(f"正在获取 {item_title} ...")
+                        logger.info(f"正在获取 {item_title} ...")
 
-                    # 检查媒体类型
-                    item_type = MediaType.TV.value if item.item_type in ["Series", "show"] else MediaType.MOVIE.value
-                    if item_type == MediaType.MOVIE.value:
-                        logger.warning(f"【{item_title}】为{MediaType.MOVIE.value}, 跳过")
-                        continue
+                        # 检查媒体类型
+                        item_type = MediaType.TV.value if item.item_type in ["Series", "show"] else MediaType.MOVIE.value
+                        if item_type == MediaType.MOVIE.value:
+                            logger.warning(f"【{item_title}】为{MediaType.MOVIE.value}, 跳过")
+                            continue
+
+                        futures[executor.submit(
+                            __process_item, mediaserver, item, item_title, item_unique_flag, item_type, ignored_seasons
+                        )] = item_title
 
-                    # 获取季信息
-                    seasoninfo = {}
-                    if item_type == MediaType.TV.value and item.tmdbid:
+                    for future in as_completed(futures):
                         try:
-                            espisodes_info = self._msChain.episodes(mediaserver, item.item_id) or []
-                            for episode_info in espisodes_info:
-                                seasoninfo[episode_info.season] = episode_info.episodes
+                            future.result()
                         except Exception as e:
-                            logger.error(f"获取剧集信息失败: {str(e)}")
-
-                    # 准备数据
-                    item_dict = item.dict()
-                    item_dict["seasoninfo"] = seasoninfo
-                    item_dict["item_type"] = item_type
-                    logger.debug(f"获到媒体库【{item_title}】数据：{item_dict}")
-
-                    # 获取缺失集数信息，传入忽略季列表
-                    is_add_subscribe_success, tv_no_exist_info = self.__get_item_no_exist_info(
-                        item_dict, ignored_seasons
-                    )
-
-                    # 处理结果
-                    if is_add_subscribe_success and tv_no_exist_info:
-                        if not tv_no_exist_info.get("season_episode_no_exist_info"):
-                            logger.info(f"【{item_title}】所有季集均已存在/订阅")
-                            __append_history(
-                                item_unique_flag=item_unique_flag,
-                                exist_status=HistoryStatus.ALL_EXIST,
-                                tv_no_exist_info=tv_no_exist_info,
-                            )
-                        else:
-                            logger.info(f"【{item_title}】缺失集数信息：{tv_no_exist_info}")
-
-                            if self._no_exist_action == NoExistAction.ADD_SUBSCRIBE.value:
-                                logger.info("开始订阅缺失集数")
-                                is_add_subscribe_success = self.__add_subscribe_by_tv_no_exist_info(
-                                    tv_no_exist_info, item_unique_flag
-                                )
-                                if is_add_subscribe_success:
-                                    __append_history(
-                                        item_unique_flag=item_unique_flag,
-                                        exist_status=HistoryStatus.ADDED_RSS,
-                                        tv_no_exist_info=tv_no_exist_info,
-                                    )
-                                else:
-                                    logger.warning(f"订阅【{item_title}】失败, 仅记录缺失集数")
-                                    __append_history(
-                                        item_unique_flag=item_unique_flag,
-                                        exist_status=HistoryStatus.NO_EXIST,
-                                        tv_no_exist_info=tv_no_exist_info,
-                                    )
-                            elif self._no_exist_action == NoExistAction.SET_ALL_EXIST.value:
-                                logger.debug("将缺失季集标记为存在")
-                                __append_history(
-                                    item_unique_flag=item_unique_flag,
-                                    exist_status=HistoryStatus.ALL_EXIST,
-                                    tv_no_exist_info=tv_no_exist_info,
-                                )
-                            else:
-                                logger.debug("仅记录缺失集数")
-                                __append_history(
-                                    item_unique_flag=item_unique_flag,
-                                    exist_status=HistoryStatus.NO_EXIST,
-                                    tv_no_exist_info=tv_no_exist_info,
-                                )
-                    else:
-                        logger.warning(f"【{item_title}】获取缺失集数信息失败")
-                        __append_history(
-                            item_unique_flag=item_unique_flag,
-                            exist_status=HistoryStatus.FAILED,
-                            tv_no_exist_info=tv_no_exist_info,
-                        )
+                            logger.error(f"【{futures[future]}】处理失败: {str(e)}")
 
                 logger.info(f"{mediaserver} 媒体库 {library.name} 获取数据完成")
 
         logger.info(f"媒体库缺失集数据获取完成, 已处理媒体数量: {item_count}")
+
+        # 保存TMDB剧集缓存
+        self.__save_tmdb_cache()
         
         # ==== 新增：同步历史记录，删除已不存在的电视剧 ====
         with self._lock:
@@ -649,9 +935,13 @@ class GetMissingEpisodes(_PluginBase):
                     removed_count += 1
             if removed_count > 0:
                 logger.info(f"历史记录同步完成，已删除 {removed_count} 条不存在的记录")
-                self.save_data("history", history_data)
+                self._history_dirty = True
+                self._history_pending = history_data
             else:
                 logger.debug("历史记录同步完成，无需删除")
+
+        # 扫描结束，立即写入检查记录
+        self.__flush_history()
         # ==== 结束新增 ====
 
     def __get_item_no_exist_info(
@@ -688,7 +978,7 @@ class GetMissingEpisodes(_PluginBase):
             episode_total: int,
             episode_total_unfiltered: int,
         ):
-            logger.debug(f"添加【{title}】第【{season}】季缺失集：{episode_no_exist}")
+            logger.debug("添加【%s】第【%s】季缺失集：%s", title, season, episode_no_exist)
             season_info: GetMissingEpisodesInfo = {
                 "season": season,
                 "episode_no_exist": episode_no_exist,
@@ -697,20 +987,23 @@ class GetMissingEpisodes(_PluginBase):
             }
             
             tv_no_exist_info["season_episode_no_exist_info"][str(season)] = season_info
-            logger.debug(f"【{title}】缺失季集数的电视剧信息：{tv_no_exist_info}")
+            logger.debug("【%s】缺失季集数的电视剧信息：%s", title, tv_no_exist_info)
 
         exist_season_info = item_dict.get("seasoninfo") or {}
-        logger.debug(f"【{title}】在媒体库已有季集信息：{exist_season_info}")
+        logger.debug("【%s】在媒体库已有季集信息：%s", title, exist_season_info)
 
-        # 获取媒体信息
-        try:
-            tmdbinfo = self._mediaChain.recognize_media(
-                mtype=MediaType.TV,
-                tmdbid=tmdbid,
-            )
-        except Exception as e:
-            logger.error(f"获取媒体信息失败: {str(e)}")
-            return False, tv_no_exist_info
+        # 获取媒体信息，同一剧集在多个媒体库中出现时只识别一次
+        tmdbinfo = self._recognize_cache.get(tmdbid)
+        if tmdbinfo is None:
+            try:
+                tmdbinfo = self._mediaChain.recognize_media(
+                    mtype=MediaType.TV,
+                    tmdbid=tmdbid,
+                )
+            except Exception as e:
+                logger.error(f"获取媒体信息失败: {str(e)}")
+                return False, tv_no_exist_info
+            self._recognize_cache[tmdbid] = tmdbinfo or False
 
         if tmdbinfo:
             # 获取剧集状态并转换为中文
@@ -742,102 +1035,63 @@ class GetMissingEpisodes(_PluginBase):
                 logger.debug(f"【{title}】未获取到TMDB季集信息, 跳过获取缺失集数")
                 return False, tv_no_exist_info
 
-            if not exist_season_info and not self._only_season_exist:
-                logger.debug(f"【{title}】全部季不存在, 添加全部季集数")
-                # 全部季不存在
-                for season, _ in tmdbinfo_seasons:
-                    # 检查是否跳过S00季
-                    if season == 0 and not self._include_s00_season:
-                        logger.debug(f"【{title}】跳过S00季检测")
-                        continue
-                    
-                    # 检查是否被手动忽略
-                    if season in ignored_seasons:
-                        logger.info(f"【{title}】第【{season}】季已在忽略列表中，跳过检测")
-                        continue
-                    
-                    filted_episodes = self.__filter_episodes(tmdbid, season, title)
-                    if not filted_episodes:
-                        logger.debug(f"【{title}】第【{season}】季未获取到TMDB集数信息, 跳过")
-                        continue
-                        
-                    # 判断用户是否已经添加订阅
-                    if self._subOper.exists(tmdbid, None, season=season):
-                        logger.info(f"【{title}】第【{season}】季已存在订阅, 跳过")
-                        continue
-                    
-                    # 获取实际总集数
-                    episode_total_unfiltered = self.__get_total_episodes_unfiltered(tmdbid, season)
-                        
-                    __append_season_info(
-                        season=season,
-                        episode_no_exist=[],
-                        episode_total=len(filted_episodes),
-                        episode_total_unfiltered=episode_total_unfiltered,
-                    )
-            else:
-                logger.debug(f"【{title}】检查每季缺失的集")
-                # 检查每季缺失的季集
-                for season, _ in tmdbinfo_seasons:
-                    # 检查是否跳过S00季
-                    if season == 0 and not self._include_s00_season:
-                        logger.debug(f"【{title}】跳过S00季检测")
-                        continue
-                    
-                    # 检查是否被手动忽略
-                    if season in ignored_seasons:
-                        logger.info(f"【{title}】第【{season}】季已在忽略列表中，跳过检测")
-                        continue
-                    
-                    filted_episodes = self.__filter_episodes(tmdbid, season, title)
-                    logger.debug(f"【{title}】第【{season}】季在TMDB的集数信息: {filted_episodes}")
-                    if not filted_episodes:
-                        logger.debug(f"【{title}】第【{season}】季未获取到TMDB集数信息, 跳过")
-                        continue
-                        
-                    # 该季总集数（筛选后的）
-                    episode_total = len(filted_episodes)
-                    
-                    # 获取实际总集数
-                    episode_total_unfiltered = self.__get_total_episodes_unfiltered(tmdbid, season)
+            # 一次性获取该剧已订阅的季
+            subscribed_seasons = self.__get_subscribed_seasons(tmdbid)
 
-                    # 该季已存在的集
-                    exist_episode = exist_season_info.get(season)
-                    logger.debug(f"【{title}】第【{season}】季在媒体库已存在的集数信息: {exist_episode}")
-                    
-                    # 判断用户是否已经添加订阅
-                    if self._subOper.exists(tmdbid, None, season=season):
-                        logger.info(f"【{title}】第【{season}】季已存在订阅, 跳过")
-                        continue
-                        
-                    if exist_episode:
-                        logger.debug(f"查找【{title}】第【{season}】季缺失集集数")
-                        # 按TMDB集数查找缺失集
-                        lack_episode = list(set(filted_episodes).difference(set(exist_episode)))
-
-                        if not lack_episode:
-                            logger.debug(f"【{title}】第【{season}】季全部集存在")
-                            continue
+            logger.debug(f"【{title}】检查每季缺失的集")
+            # 检查每季缺失的季集
+            for season, _ in tmdbinfo_seasons:
+                # 检查是否跳过S00季
+                if season == 0 and not self._include_s00_season:
+                    logger.debug(f"【{title}】跳过S00季检测")
+                    continue
 
-                        # 添加不存在的季集信息
-                        __append_season_info(
-                            season=season,
-                            episode_no_exist=lack_episode,
-                            episode_total=episode_total,
-                            episode_total_unfiltered=episode_total_unfiltered,
-                        )
-                    else:
-                        logger.debug(f"【{title}】第【{season}】季全集不存在")
-                        # 该季全集不存在，选项仅检查已有季缺失未开启时添加全部集
-                        if not self._only_season_exist:
-                            __append_season_info(
-                                season=season,
-                                episode_no_exist=[],
-                                episode_total=episode_total,
-                                episode_total_unfiltered=episode_total_unfiltered,
-                            )
+                # 检查是否被手动忽略
+                if season in ignored_seasons:
+                    logger.info(f"【{title}】第【{season}】季已在忽略列表中，跳过检测")
+                    continue
+
+                # 该季已存在的集
+                exist_episode = exist_season_info.get(season)
+                logger.debug("【%s】第【%s】季在媒体库已存在的集数信息: %s", title, season, exist_episode)
+
+                # 该季全集不存在，且仅检查已有季缺失时，无需获取TMDB集数信息
+                if not exist_episode and self._only_season_exist:
+                    logger.debug(f"【{title}】第【{season}】季全集不存在, 跳过")
+                    continue
+
+                filted_episodes, episode_total_unfiltered = self.__get_season_episodes(tmdbid, season, title, status)
+                logger.debug("【%s】第【%s】季在TMDB的集数信息: %s", title, season, filted_episodes)
+                if not filted_episodes:
+                    logger.debug(f"【{title}】第【{season}】季未获取到TMDB集数信息, 跳过")
+                    continue
+
+                # 判断用户是否已经添加订阅（第0季沿用原逻辑：该剧存在任意订阅即视为已订阅）
+                if season in subscribed_seasons or (season == 0 and subscribed_seasons):
+                    logger.info(f"【{title}】第【{season}】季已存在订阅, 跳过")
+                    continue
+
+                if exist_episode:
+                    logger.debug(f"查找【{title}】第【{season}】季缺失集集数")
+                    # 按TMDB集数查找缺失集
+                    lack_episode = [episode for episode in filted_episodes if episode not in exist_episode]
+                    if not lack_episode:
+                        logger.debug(f"【{title}】第【{season}】季全部集存在")
+                        continue
+                else:
+                    # 该季全集不存在，添加全部集
+                    logger.debug(f"【{title}】第【{season}】季全集不存在")
+                    lack_episode = []
+
+                # 添加不存在的季集信息
+                __append_season_info(
+                    season=season,
+                    episode_no_exist=lack_episode,
+                    episode_total=len(filted_episodes),
+                    episode_total_unfiltered=episode_total_unfiltered,
+                )
 
-            logger.debug(f"【{title}】季集信息: {tv_no_exist_info}")
+            logger.debug("【%s】季集信息: %s", title, tv_no_exist_info)
 
             # 存在不完整的剧集
             if tv_no_exist_info["season_episode_no_exist_info"]:
@@ -852,95 +1106,186 @@ class GetMissingEpisodes(_PluginBase):
             logger.debug(f"【{title}】未获取到TMDB信息, 跳过获取缺失集数")
             return False, tv_no_exist_info
 
+    def __get_subscribed_seasons(self, tmdbid: int) -> set[int]:
+        """获取剧集已订阅的季号集合"""
+        try:
+            subscribes = self._subOper.list_by_tmdbid(tmdbid) or []
+        except Exception as e:
+            logger.error(f"获取订阅信息失败: {str(e)}")
+            return set()
+        return {subscribe.season for subscribe in subscribes if subscribe.season is not None}
+
     def __convert_status_to_cn(self, status: str) -> str:
         """将剧集状态转换为中文"""
-        status_mapping = {
-            'Returning Series': '播出中',
-            'Planned': '计划中',
-            'In Production': '制作中',
-            'Ended': '已完结',
-            'Canceled': '已取消',
-            'Cancelled': '已取消',
-            'Pilot': '试播集',
-            'Released': '已发布',
-            'Post Production': '后期制作',
-            'Returning': '回归中',
-            'Rumored': '传言中',
-            'In Development': '开发中',
-            'Unknown': '未知状态',
-            '': '未知状态',
-        }
-        
+        status = status or ""
+
         # 尝试直接匹配
-        if status in status_mapping:
-            return status_mapping[status]
-        
+        status_cn = STATUS_MAP.get(status)
+        if status_cn:
+            return status_cn
+
+        # 尝试忽略大小写匹配
+        status_lower = status.casefold()
+        status_cn = STATUS_MAP_LOWER.get(status_lower)
+        if status_cn:
+            return status_cn
+
         # 尝试模糊匹配
-        status_lower = status.lower()
-        for key, value in status_mapping.items():
-            if key.lower() in status_lower or status_lower in key.lower():
+        for key, value in STATUS_MAP_LOWER.items():
+            if key in status_lower or status_lower in key:
                 return value
         
         # 默认返回原始状态
         return status
 
-    def __filter_episodes(self, tmdbid, season, title):
-        """筛选剧集"""
+    def __get_episodes_cached(self, tmdbid, season, status: str | None = None) -> list:
+        """获取TMDB剧集信息，同一次扫描内每季只请求一次，跨扫描按剧集状态缓存"""
+        cache_key = (tmdbid, season)
+        if cache_key in self._episodes_cache:
+            return self._episodes_cache[cache_key]
+
+        episodes_info = self.__get_tmdb_cache(tmdbid, season, status)
+        if episodes_info is not None:
+            self._episodes_cache[cache_key] = episodes_info
+            return episodes_info
+
         try:
-            episodes_info = self._tmdbChain.tmdb_episodes(tmdbid=tmdbid, season=season)
+            episodes_info = self._tmdbChain.tmdb_episodes(tmdbid=tmdbid, season=season) or []
         except Exception as e:
             logger.error(f"获取TMDB剧集信息失败: {str(e)}")
             return []
 
-        episodes = []
-        
-        # 如果需要检查播出时间，预先获取当前时间
-        current_date = None
-        if self._only_aired:
-            current_time = datetime.datetime.now(tz=pytz.timezone(settings.TZ))
-            current_date = current_time.date()
-
-        for episode in episodes_info:
-            if episode:
-                episode_name = f"【{title}】第 {season}季 {episode.name}"
-                
-                # 如果有播出日期
-                if episode.air_date:
+        self._episodes_cache[cache_key] = episodes_info
+        # 空结果可能是TMDB临时故障，不持久化，下次扫描重新获取
+        if episodes_info:
+            self.__set_tmdb_cache(tmdbid, season, status, episodes_info)
+        return episodes_info
+
+    def __get_tmdb_cache(self, tmdbid, season, status: str | None = None) -> list | None:
+        """读取未过期的TMDB剧集缓存，未命中返回None"""
+        entry = self._tmdb_cache.get(f"{tmdbid}_{season}")
+        if not entry or not entry.get("episodes"):
+            return None
+
+        try:
+            fetched_at = datetime.datetime.fromisoformat(entry.get("fetched_at"))
+        except (TypeError, ValueError):
+            return None
+
+        status = status or entry.get("status")
+        ttl = TMDB_CACHE_TTL_FINISHED if status in TMDB_CACHE_FINISHED_STATUSES else TMDB_CACHE_TTL_AIRING
+        if datetime.datetime.now(tz=self._tz) - fetched_at > ttl:
+            return None
+
+        try:
+            return [schemas.TmdbEpisode(**episode) for episode in entry["episodes"]]
+        except Exception as e:
+            logger.debug(f"解析TMDB剧集缓存失败: {str(e)}")
+            return None
+
+    def __set_tmdb_cache(self, tmdbid, season, status: str | None, episodes_info: list):
+        """写入TMDB剧集缓存，扫描结束时统一保存"""
+        entry = {
+            "episodes": [
+                {
+                    "episode_number": episode.episode_number,
+                    "air_date": episode.air_date,
+                }
+                for episode in episodes_info
+                if episode
+            ],
+            "fetched_at": datetime.datetime.now(tz=self._tz).isoformat(),
+            "status": status or "Unknown",
+        }
+        with self._lock:
+            self._tmdb_cache[f"{tmdbid}_{season}"] = entry
+
+    def __save_tmdb_cache(self):
+        """清理过期条目并保存TMDB剧集缓存"""
+        now = datetime.datetime.now(tz=self._tz)
+        with self._lock:
+            expired_keys = []
+            for key, entry in self._tmdb_cache.items():
+                # 清理旧版本写入的空结果
+                if not entry.get("episodes"):
+                    expired_keys.append(key)
+                    continue
+                try:
+                    fetched_at = datetime.datetime.fromisoformat(entry.get("fetched_at"))
+                except (TypeError, ValueError):
+                    expired_keys.append(key)
+                    continue
+                if now - fetched_at > TMDB_CACHE_TTL_FINISHED:
+                    expired_keys.append(key)
+            for key in expired_keys:
+                del self._tmdb_cache[key]
+            tmdb_cache = dict(self._tmdb_cache)
+
+        self.save_data("tmdb_cache", tmdb_cache)
+        logger.debug(f"已保存TMDB剧集缓存, 共 {len(tmdb_cache)} 条")
+
+    def __get_season_episodes(self, tmdbid, season, title, status: str | None = None) -> tuple[List[int], int]:
+        """获取筛选后的集列表及实际总集数"""
+        filted_episodes = self.__filter_episodes(tmdbid, season, title, status)
+        # 未开启仅已开播时未做筛选，筛选后的集数即实际总集数
+        if not self._only_aired:
+            return filted_episodes, len(filted_episodes)
+        episode_total_unfiltered = self.__get_total_episodes_unfiltered(tmdbid, season, status)
+        return filted_episodes, episode_total_unfiltered
+
+    def __filter_episodes(self, tmdbid, season, title, status: str | None = None):
+        """筛选剧集"""
+        episodes_info = self.__get_episodes_cached(tmdbid, season, status)
+
+        if not self._only_aired:
+            # 全部：包括所有剧集，无论是否开播
+            episodes = [episode.episode_number for episode in episodes_info if episode]
+            logger.debug("筛选后的集数: %s", episodes)
+            return episodes
+
+        # 仅已开播：只包括已开播的剧集（YYYY-MM-DD 格式可直接按字符串比较）
+        current_time = datetime.datetime.now(tz=self._tz)
+        current_iso = current_time.date().isoformat()
+        episodes = [
+            episode.episode_number
+            for episode in episodes_info
+            if episode and episode.air_date and is_iso_date_str(episode.air_date) and episode.air_date <= current_iso
+        ]
+
+        # 存在未计入的集时，逐个确认原因并输出日志
+        if len(episodes) < len(episodes_info):
+            for episode in episodes_info:
+                if not episode:
+                    continue
+                air_date = episode.air_date
+                if air_date and is_iso_date_str(air_date) and air_date <= current_iso:
+                    continue
+
+                episode_name = f"【{title}】第 {season}季 {episode.name or f'第{episode.episode_number}集'}"
+                if not air_date:
+                    # 没有播出日期，视为未开播
+                    logger.info(f"{episode_name} 没有播出日期信息，视为未开播，不添加进集统计")
+                    continue
+
+                if not is_iso_date_str(air_date):
                     try:
-                        air_date = datetime.datetime.strptime(episode.air_date, "%Y-%m-%d").date()
-                        if self._only_aired:
-                            # 仅已开播：只包括已开播的剧集
-                            if air_date <= current_date:
-                                episodes.append(episode.episode_number)
-                            else:
-                                logger.info(f"{episode_name} 发布时间: {episode.air_date} 未开播，不添加进集统计")
-                        else:
-                            # 全部：包括所有剧集，无论是否开播
-                            episodes.append(episode.episode_number)
+                        air_date = datetime.date.fromisoformat(air_date).isoformat()
                     except ValueError as e:
                         logger.warning(f"{episode_name} 播出日期格式错误: {episode.air_date}, 错误: {str(e)}")
-                        if not self._only_aired:
-                            episodes.append(episode.episode_number)
-                else:
-                    # 没有播出日期，视为未开播
-                    logger.info(f"{episode_name} 没有播出日期信息，视为未开播，不添加进集统计")
-                    if not self._only_aired:
+                        continue
+                    if air_date <= current_iso:
                         episodes.append(episode.episode_number)
+                        continue
 
-        logger.debug(f"筛选后的集数: {episodes}")
+                logger.info(f"{episode_name} 发布时间: {episode.air_date} 未开播，不添加进集统计")
+
+        logger.debug("筛选后的集数: %s", episodes)
         return episodes
 
-    def __get_total_episodes_unfiltered(self, tmdbid, season):
+    def __get_total_episodes_unfiltered(self, tmdbid, season, status: str | None = None):
         """获取实际总集数（不经过筛选）"""
-        try:
-            episodes_info = self._tmdbChain.tmdb_episodes(tmdbid=tmdbid, season=season)
-            if episodes_info:
-                return len(episodes_info)
-        except Exception as e:
-            logger.error(f"获取TMDB实际总集数失败: {str(e)}")
-        
         # 如果获取失败，返回0
-        return 0
+        return len(self.__get_episodes_cached(tmdbid, season, status))
 
     def _update_config(self):
         """更新配置"""
@@ -957,6 +1302,7 @@ class GetMissingEpisodes(_PluginBase):
             "whitelist_media_servers": ",".join(self._whitelist_media_servers) if self._whitelist_media_servers else "",
             "auto_skip_finished": self._auto_skip_finished,
             "include_s00_season": self._include_s00_season,
+            "max_workers": self._max_workers,
         }
         logger.info(f"更新配置 {config}")
         self.update_config(config)
@@ -971,9 +1317,44 @@ class GetMissingEpisodes(_PluginBase):
                     self._scheduler.shutdown()
                     self._event.clear()
                 self._scheduler = None
+            # 写入尚未保存的检查记录
+            self.__flush_history()
         except Exception as e:
             logger.error(f"停止服务时出错: {str(e)}")
 
+    def __get_history(self) -> Optional[Dict[str, Any]]:
+        """获取检查记录，优先使用内存副本"""
+        with self._lock:
+            if self._history is None:
+                self._history = self.get_data("history") or None
+            return self._history
+
+    def __schedule_history_flush(self, history: Dict[str, Any]):
+        """标记检查记录已变更，并在延迟后写入存储"""
+        self._history_dirty = True
+        self._history_pending = history
+        if self._history_flush_timer is None:
+            self._history_flush_timer = Timer(HISTORY_FLUSH_DELAY, self.__flush_history)
+            self._history_flush_timer.daemon = True
+            self._history_flush_timer.start()
+
+    def __flush_history(self):
+        """将已变更的检查记录写入存储"""
+        with self._lock:
+            if self._history_flush_timer:
+                self._history_flush_timer.cancel()
+                self._history_flush_timer = None
+            history = self._history_pending
+            if not self._history_dirty or history is None:
+                return
+            # 锁内复制记录快照，锁外序列化写入
+            snapshot = {
+                **history,
+                "details": {key: dict(record) for key, record in history.get("details", {}).items()}
+            }
+            self._history_dirty = False
+        self.save_data("history", snapshot)
+
     @staticmethod
     def __remove_history_by_unique(historys, unique: str):
         """根据唯一标识删除历史记录"""
@@ -999,16 +1380,12 @@ class GetMissingEpisodes(_PluginBase):
         logger.info(f"开始检查 {title_season} 是否已添加订阅")
 
         save_path_replaced = None
-        if self._save_path_replaces and save_path:
-            for _save_path_replace in self._save_path_replaces:
-                replace_list = [part.strip() for part in _save_path_replace.split(":") if part.strip()]
-                if len(replace_list) < 2:
-                    continue
-                _lib_path_str, _save_path_str = replace_list[:2]
+        if self._save_path_rules and save_path:
+            for _lib_path_str, _save_path_str in self._save_path_rules:
                 logger.debug(f"替换路径: {_lib_path_str} -> {_save_path_str}")
                 # 使用精确的路径前缀匹配
                 if save_path.startswith(_lib_path_str):
-                    save_path_replaced = save_path.replace(_lib_path_str, _save_path_str, 1)
+                    save_path_replaced = _save_path_str + save_path[len(_lib_path_str):]
                     logger.info(f"{title_season} 的下载路径替换为: {save_path_replaced}")
                     break
 
@@ -1053,13 +1430,12 @@ class GetMissingEpisodes(_PluginBase):
             return False
 
     @staticmethod
-    def __update_exist_status_by_unique(historys, unique: str, new_status: str):
+    def __update_exist_status_by_unique(historys, unique: str, new_status: str, now_str: str):
         """根据唯一标识更新存在状态"""
         if unique in historys["details"]:
             historys["details"][unique]["exist_status"] = new_status
             # 状态变化时更新最后状态变更时间
-            current_time = datetime.datetime.now(tz=pytz.timezone(settings.TZ))
-            historys["details"][unique]["last_status_change"] = current_time.strftime("%Y-%m-%d %H:%M:%S")
+            historys["details"][unique]["last_status_change"] = now_str
             logger.info(f"更新检查记录 {unique} 状态为: {new_status}")
             return True, historys
         else:
@@ -1081,11 +1457,11 @@ class GetMissingEpisodes(_PluginBase):
             return False
 
         all_success = True
-        for season_key in season_episode_no_exist_info.keys():
-            season_info = season_episode_no_exist_info.get(season_key)
-            total_episode = season_info.get("episode_total") if season_info else None
-            total_episode_unfiltered = season_info.get("episode_total_unfiltered") if season_info else None
-            episode_no_exist = season_info.get("episode_no_exist") if season_info else None
+        for season_key, season_info in season_episode_no_exist_info.items():
+            season_info = season_info or {}
+            total_episode = season_info.get("episode_total")
+            total_episode_unfiltered = season_info.get("episode_total_unfiltered")
+            episode_no_exist = season_info.get("episode_no_exist")
             
             if not episode_no_exist:
                 logger.info(f"【{title}】第 {season_key} 季所有集均缺失, 仅添加已有季选项为: {self._only_season_exist}")
@@ -1120,23 +1496,28 @@ class GetMissingEpisodes(_PluginBase):
         return all_success
 
     def __add_subscribe_by_unique(self, historys, unique: str):
-        """根据唯一标识添加订阅"""
-        if unique in historys["details"]:
-            tv_no_exist_info = historys["details"][unique]["tv_no_exist_info"]
-            is_add_subscribe_success = self.__add_subscribe_by_tv_no_exist_info(tv_no_exist_info, unique)
-            if is_add_subscribe_success:
-                is_update_exist_status_success, historys = self.__update_exist_status_by_unique(
-                    historys=historys,
-                    unique=unique,
-                    new_status=HistoryStatus.ADDED_RSS.value,
-                )
-                return is_update_exist_status_success, historys
-            else:
-                return False, historys
-        else:
+        """根据唯一标识添加订阅，订阅过程涉及数据库和网络请求，不持有锁"""
+        with self._lock:
+            record = historys["details"].get(unique)
+            tv_no_exist_info = record["tv_no_exist_info"] if record else None
+        if record is None:
             logger.warning(f"unique: {unique} 不在历史记录里")
             return False, historys
 
+        is_add_subscribe_success = self.__add_subscribe_by_tv_no_exist_info(tv_no_exist_info, unique)
+        if not is_add_subscribe_success:
+            return False, historys
+
+        # 只在更新检查记录状态时加锁
+        with self._lock:
+            is_update_exist_status_success, historys = self.__update_exist_status_by_unique(
+                historys=historys,
+                unique=unique,
+                new_status=HistoryStatus.ADDED_RSS.value,
+                now_str=datetime.datetime.now(tz=self._tz).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        return is_update_exist_status_success, historys
+
     def delete_history(self, key: str, apikey: str):
         """删除同步检查记录"""
         logger.info(f"开始删除检查记录: {key}")
@@ -1144,16 +1525,17 @@ class GetMissingEpisodes(_PluginBase):
             logger.warning("API密钥错误")
             return schemas.Response(success=False, message="API密钥错误")
             
-        historys = self.get_data("history")
+        historys = self.__get_history()
         if not historys:
             logger.warning("未找到检查记录")
             return schemas.Response(success=False, message="未找到检查记录")
 
-        is_success, historys = GetMissingEpisodes.__remove_history_by_unique(historys, key)
+        with self._lock:
+            is_success, historys = GetMissingEpisodes.__remove_history_by_unique(historys, key)
 
         if is_success:
             logger.info(f"删除检查记录 {key} 成功")
-            self.save_data("history", historys)
+            self.__schedule_history_flush(historys)
             return schemas.Response(success=True, message="删除成功")
         else:
             logger.warning(f"删除检查记录 {key} 失败")
@@ -1166,7 +1548,7 @@ class GetMissingEpisodes(_PluginBase):
             logger.warning("API密钥错误")
             return schemas.Response(success=False, message="API密钥错误")
             
-        historys = self.get_data("history")
+        historys = self.__get_history()
         if not historys:
             logger.warning("未找到检查记录")
             return schemas.Response(success=False, message="未找到检查记录")
@@ -1174,7 +1556,7 @@ class GetMissingEpisodes(_PluginBase):
         is_success, historys = self.__add_subscribe_by_unique(historys, key)
         if is_success:
             logger.info(f"添加 {key} 订阅成功")
-            self.save_data("history", historys)
+            self.__schedule_history_flush(historys)
             return schemas.Response(success=True, message="订阅成功")
         else:
             logger.warning(f"添加 {key} 订阅失败")
@@ -1187,38 +1569,41 @@ class GetMissingEpisodes(_PluginBase):
             logger.warning("API密钥错误")
             return schemas.Response(success=False, message="API密钥错误")
             
-        historys = self.get_data("history")
+        historys = self.__get_history()
         if not historys:
             logger.warning("未找到检查记录")
             return schemas.Response(success=False, message="未找到检查记录")
 
-        # 获取当前记录
-        record = historys["details"].get(key)
-        if not record:
-            logger.warning(f"记录不存在: {key}")
-            return schemas.Response(success=False, message="记录不存在")
-
-        # 获取当前缺失的季号列表
-        tv_info = record.get("tv_no_exist_info")
-        missing_seasons = []
-        if tv_info:
-            season_info = tv_info.get("season_episode_no_exist_info", {})
-            missing_seasons = [int(s) for s in season_info.keys()]
-
-        # 合并到忽略列表（去重）
-        ignored = record.get("ignored_seasons", [])
-        for season in missing_seasons:
-            if season not in ignored:
-                ignored.append(season)
-
-        # 更新状态为 ALL_EXIST
-        is_success, historys = self.__update_exist_status_by_unique(
-            historys, key, HistoryStatus.ALL_EXIST.value
-        )
+        with self._lock:
+            # 获取当前记录
+            record = historys["details"].get(key)
+            if not record:
+                logger.warning(f"记录不存在: {key}")
+                return schemas.Response(success=False, message="记录不存在")
+
+            # 获取当前缺失的季号列表
+            tv_info = record.get("tv_no_exist_info")
+            missing_seasons = []
+            if tv_info:
+                season_info = tv_info.get("season_episode_no_exist_info", {})
+                missing_seasons = [int(s) for s in season_info.keys()]
+
+            # 合并到忽略列表（去重）
+            ignored = list(record.get("ignored_seasons", []))
+            for season in missing_seasons:
+                if season not in ignored:
+                    ignored.append(season)
+
+            # 更新状态为 ALL_EXIST
+            now_str = datetime.datetime.now(tz=self._tz).strftime("%Y-%m-%d %H:%M:%S")
+            is_success, historys = self.__update_exist_status_by_unique(
+                historys, key, HistoryStatus.ALL_EXIST.value, now_str
+            )
+            if is_success:
+                # 保存更新后的忽略列表
+                historys["details"][key]["ignored_seasons"] = ignored
         if is_success:
-            # 保存更新后的忽略列表
-            historys["details"][key]["ignored_seasons"] = ignored
-            self.save_data("history", historys)
+            self.__schedule_history_flush(historys)
             logger.info(f"标记存在 {key} 成功，已忽略季: {missing_seasons}")
             return schemas.Response(success=True, message="标记存在成功，缺失季已加入忽略列表")
         else:
@@ -1232,18 +1617,21 @@ class GetMissingEpisodes(_PluginBase):
             logger.warning("API密钥错误")
             return schemas.Response(success=False, message="API密钥错误")
             
-        historys = self.get_data("history")
+        historys = self.__get_history()
         if not historys:
             logger.warning("未找到检查记录")
             return schemas.Response(success=False, message="未找到检查记录")
 
-        if key in historys["details"]:
-            current_skip = historys["details"][key].get("skip", False)
-            historys["details"][key]["skip"] = not current_skip
-            # 跳过状态变化时也更新状态变更时间
-            current_time = datetime.datetime.now(tz=pytz.timezone(settings.TZ))
-            historys["details"][key]["last_status_change"] = current_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.save_data("history", historys)
+        with self._lock:
+            record = historys["details"].get(key)
+            if record is not None:
+                current_skip = record.get("skip", False)
+                record["skip"] = not current_skip
+                # 跳过状态变化时也更新状态变更时间
+                current_time = datetime.datetime.now(tz=self._tz)
+                record["last_status_change"] = current_time.strftime("%Y-%m-%d %H:%M:%S")
+        if record is not None:
+            self.__schedule_history_flush(historys)
             message = "取消跳过" if current_skip else "已跳过"
             logger.info(f"{message} {key}")
             return schemas.Response(success=True, message=f"{message}成功")
@@ -1270,257 +1658,300 @@ class GetMissingEpisodes(_PluginBase):
         logger.info(f"历史数据类型已设置为: {history_type}")
         return schemas.Response(success=True, message="设置成功")
 
-    def get_form(self) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        # 获取所有可用的媒体库
-        available_libraries = []
+    def __get_available_libraries(self) -> List[str]:
+        """获取所有可用的媒体库名称，短时间内重复打开配置页面时使用缓存"""
         try:
-            mediaservers = self._msHelper.get_services()
-            if mediaservers:
-                for mediaserver in mediaservers:
-                    librarys = self._msChain.librarys(mediaserver)
-                    for library in librarys:
-                        available_libraries.append(library.name)
+            mediaservers = tuple(self._msHelper.get_services() or ())
+        except Exception as e:
+            logger.error(f"获取媒体服务器失败: {str(e)}")
+            return []
+
+        cache = self._form_libraries_cache
+        if cache and cache[1] == mediaservers:
+            # 缓存过期时先返回旧数据，后台刷新，避免打开配置页面时等待媒体服务器
+            if time.monotonic() - cache[0] >= FORM_LIBRARIES_CACHE_TTL and not self._form_libraries_refreshing:
+                self._form_libraries_refreshing = True
+                Thread(target=self.__load_available_libraries, args=(mediaservers,), daemon=True).start()
+            return cache[2]
+
+        return self.__load_available_libraries(mediaservers)
+
+    def __load_available_libraries(self, mediaservers: tuple) -> List[str]:
+        """从媒体服务器获取媒体库名称并更新缓存"""
+        # 获取时即去重
+        library_names: Dict[str, None] = {}
+        try:
+            for mediaserver in mediaservers:
+                for library in self._msChain.librarys(mediaserver) or ():
+                    library_names[library.name] = None
         except Exception as e:
             logger.error(f"获取媒体库列表失败: {str(e)}")
-        
-        # 去重并排序
-        available_libraries = sorted(list(set(available_libraries)))
-        
-        # 构建媒体库选项
-        library_items = [{"title": lib, "value": lib} for lib in available_libraries]
-        
-        return [
+            return sorted(library_names)
+        finally:
+            self._form_libraries_refreshing = False
+
+        available_libraries = sorted(library_names)
+        self._form_libraries_cache = (time.monotonic(), mediaservers, available_libraries)
+        return available_libraries
+
+    @staticmethod
+    @cache
+    def __get_form_rows() -> tuple[tuple[dict[str, Any], ...], tuple[dict[str, Any], ...]]:
+        """
+        构建配置页面中与媒体库列表无关的静态部分，只构建一次
+        """
+        head_rows = (
             {
-                "component": "VForm",
+                "component": "VRow",
                 "content": [
                     {
-                        "component": "VRow",
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
                         "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "enabled",
-                                            "label": "启用插件",
-                                        },
-                                    }
-                                ],
-                            },                            
-                            {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "only_aired",
-                                            "label": "仅订阅已开播剧集",
-                                            "hint": "开启：只订阅已开播的剧集；关闭：订阅所有剧集（包括未开播）",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "enabled",
+                                    "label": "启用插件",
+                                },
+                            }
+                        ],
+                    },                            
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "auto_skip_finished",
-                                            "label": "自动跳过已完结剧集",
-                                            "hint": "开启：已完结的剧集自动跳过检测；关闭：正常检测已完结剧集（注意：因TMDB剧集状态可随意编辑不一定准确，部分剧集实际并未完结却被标记成已完结，而导致插件漏检。出现此情况可自行去TMDB更改剧集状态，然后手动取消跳过该剧集。）",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "only_aired",
+                                    "label": "仅订阅已开播剧集",
+                                    "hint": "开启：只订阅已开播的剧集；关闭：订阅所有剧集（包括未开播）",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "only_season_exist",
-                                            "label": "仅检查已有季缺失",
-                                            "hint": "开启：只检查媒体库中所有剧（除已跳过）已存在的季是否有集的缺失；关闭：检查媒体库中所有剧（除已跳过）是否存在季和集的缺失",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "auto_skip_finished",
+                                    "label": "自动跳过已完结剧集",
+                                    "hint": "开启：已完结的剧集自动跳过检测；关闭：正常检测已完结剧集（注意：因TMDB剧集状态可随意编辑不一定准确，部分剧集实际并未完结却被标记成已完结，而导致插件漏检。出现此情况可自行去TMDB更改剧集状态，然后手动取消跳过该剧集。）",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "include_s00_season",
-                                            "label": "包含S00季检测",
-                                            "hint": "开启：S00季（特别季/特典季）纳入缺失检测；关闭：跳过S00季检测",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "only_season_exist",
+                                    "label": "仅检查已有季缺失",
+                                    "hint": "开启：只检查媒体库中所有剧（除已跳过）已存在的季是否有集的缺失；关闭：检查媒体库中所有剧（除已跳过）是否存在季和集的缺失",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "clear",
-                                            "label": "清理检查记录",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "include_s00_season",
+                                    "label": "包含S00季检测",
+                                    "hint": "开启：S00季（特别季/特典季）纳入缺失检测；关闭：跳过S00季检测",
+                                },
+                            }
+                        ],
+                    },
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 4},
-                                "content": [
-                                    {
-                                        "component": "VSwitch",
-                                        "props": {
-                                            "model": "onlyonce",
-                                            "label": "立即运行一次",
-                                        },
-                                    }
-                                ],
-                            },                   
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "clear",
+                                    "label": "清理检查记录",
+                                },
+                            }
                         ],
                     },
                     {
-                        "component": "VRow",
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
                         "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 6},
-                                "content": [
-                                    {
-                                        "component": "VTextField",
-                                        "props": {
-                                            "model": "cron",
-                                            "label": "执行周期",
-                                            "placeholder": "5位cron表达式, 留空自动",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VSwitch",
+                                "props": {
+                                    "model": "onlyonce",
+                                    "label": "立即运行一次",
+                                },
+                            }
+                        ],
+                    },                   
+                ],
+            },
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
+                        "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 6},
-                                "content": [
-                                    {
-                                        "component": "VSelect",
-                                        "props": {
-                                            "model": "no_exist_action",
-                                            "label": "缺失处理方式",
-                                            "items": [
-                                                {
-                                                    "title": f"{NoExistAction.ONLY_HISTORY.value}",
-                                                    "value": f"{NoExistAction.ONLY_HISTORY.value}",
-                                                },
-                                                {
-                                                    "title": f"{NoExistAction.ADD_SUBSCRIBE.value}",
-                                                    "value": f"{NoExistAction.ADD_SUBSCRIBE.value}",
-                                                },
-                                                {
-                                                    "title": f"{NoExistAction.SET_ALL_EXIST.value}",
-                                                    "value": f"{NoExistAction.SET_ALL_EXIST.value}",
-                                                },
-                                            ],
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VTextField",
+                                "props": {
+                                    "model": "cron",
+                                    "label": "执行周期",
+                                    "placeholder": "5位cron表达式, 留空自动",
+                                },
+                            }
                         ],
                     },
                     {
-                        "component": "VRow",
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
                         "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 12},
-                                "content": [
-                                    {
-                                        "component": "VSelect",
-                                        "props": {
-                                            "model": "whitelist_librarys",
-                                            "label": "电视剧媒体库白名单",
-                                            "items": library_items,
-                                            "multiple": True,
-                                            "chips": True,
-                                            "closable-chips": True,
-                                            "placeholder": "请选择要检查的电视剧媒体库",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VTextField",
+                                "props": {
+                                    "model": "max_workers",
+                                    "label": "并发线程数",
+                                    "type": "number",
+                                    "placeholder": f"同时检测的剧集数量, 默认8, 最大{MAX_WORKERS_LIMIT}",
+                                },
+                            }
                         ],
                     },
                     {
-                        "component": "VRow",
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 4},
                         "content": [
                             {
-                                "component": "VCol",
-                                "props": {"cols": 12, "md": 12},
-                                "content": [
-                                    {
-                                        "component": "VTextField",
-                                        "props": {
-                                            "model": "whitelist_media_servers",
-                                            "label": "媒体服务器名称白名单",
-                                            "placeholder": "留空默认全部, 多个名称用英文逗号分隔: emby,embyA,embyB,jellyfin,plex",
-                                        },
-                                    }
-                                ],
-                            },
+                                "component": "VSelect",
+                                "props": {
+                                    "model": "no_exist_action",
+                                    "label": "缺失处理方式",
+                                    "items": [
+                                        {"title": action.value, "value": action.value}
+                                        for action in NoExistAction
+                                    ],
+                                },
+                            }
                         ],
                     },
+                ],
+            },
+        )
+        tail_rows = (
+            {
+                "component": "VRow",
+                "content": [
                     {
-                        "component": "VRow",
+                        "component": "VCol",
+                        "props": {"cols": 12, "md": 12},
                         "content": [
                             {
-                                "component": "VCol",
-                                "content": [
-                                    {
-                                        "component": "VTextarea",
-                                        "props": {
-                                            "model": "save_path_replaces",
-                                            "label": "下载路径替换, 一行一个",
-                                            "placeholder": "将媒体库电视剧的路径替换为下载路径, 用英文冒号作为分割。不输入则按默认下载路径处理。\n例如将'/media/library/tv/上载新生 (2020)'的下载路径设置为'/downloads/tv', 则输入 /media/library:/downloads",
-                                        },
-                                    }
-                                ],
+                                "component": "VTextField",
+                                "props": {
+                                    "model": "whitelist_media_servers",
+                                    "label": "媒体服务器名称白名单",
+                                    "placeholder": "留空默认全部, 多个名称用英文逗号分隔: emby,embyA,embyB,jellyfin,plex",
+                                },
                             }
                         ],
                     },
+                ],
+            },
+            {
+                "component": "VRow",
+                "content": [
+                    {
+                        "component": "VCol",
+                        "content": [
+                            {
+                                "component": "VTextarea",
+                                "props": {
+                                    "model": "save_path_replaces",
+                                    "label": "下载路径替换, 一行一个",
+                                    "placeholder": "将媒体库电视剧的路径替换为下载路径, 用英文冒号作为分割。不输入则按默认下载路径处理。\n例如将'/media/library/tv/上载新生 (2020)'的下载路径设置为'/downloads/tv', 则输入 /media/library:/downloads",
+                                },
+                            }
+                        ],
+                    }
+                ],
+            },
+            {
+                'component': 'VRow',
+                'content': [
                     {
-                        'component': 'VRow',
+                        'component': 'VCol',
+                        'props': {
+                            'cols': 12,
+                        },
                         'content': [
                             {
-                                'component': 'VCol',
+                                'component': 'VAlert',
                                 'props': {
-                                    'cols': 12,
-                                },
-                                'content': [
-                                    {
-                                        'component': 'VAlert',
-                                        'props': {
-                                            'type': 'info',
-                                            'variant': 'tonal',
-                                            'text': '注意：插件首次检测时建议缺失处理方式选择[仅检查记录]，根据检查记录手动跳过一些不需要持续检测的剧集，然后再将缺失处理方式改为[添加到订阅]，以尽量避免因TMDB上某些剧集信息错误而产生误订阅。'
-                                        }
-                                    }
-                                ]
+                                    'type': 'info',
+                                    'variant': 'tonal',
+                                    'text': '注意：插件首次检测时建议缺失处理方式选择[仅检查记录]，根据检查记录手动跳过一些不需要持续检测的剧集，然后再将缺失处理方式改为[添加到订阅]，以尽量避免因TMDB上某些剧集信息错误而产生误订阅。'
+                                }
                             }
                         ]
                     }
-                ],
+                ]
+            },
+        )
+        return head_rows, tail_rows
+
+    def get_form(self) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        # 获取所有可用的媒体库
+        available_libraries = self.__get_available_libraries()
+        
+        # 构建媒体库选项
+        library_items = [{"title": lib, "value": lib} for lib in available_libraries]
+
+        # 媒体库白名单之外的表单内容不随配置变化，复用缓存
+        head_rows, tail_rows = self.__get_form_rows()
+        library_row = {
+            "component": "VRow",
+            "content": [
+                {
+                    "component": "VCol",
+                    "props": {"cols": 12, "md": 12},
+                    "content": [
+                        {
+                            "component": "VSelect",
+                            "props": {
+                                "model": "whitelist_librarys",
+                                "label": "电视剧媒体库白名单",
+                                "items": library_items,
+                                "multiple": True,
+                                "chips": True,
+                                "closable-chips": True,
+                                "placeholder": "请选择要检查的电视剧媒体库",
+                            },
+                        }
+                    ],
+                },
+            ],
+        }
+        
+        return [
+            {
+                "component": "VForm",
+                "content": [*head_rows, library_row, *tail_rows],
             }
         ], {
             "enabled": False,
@@ -1530,6 +1961,7 @@ class GetMissingEpisodes(_PluginBase):
             "only_aired": True,
             "auto_skip_finished": False,
             "include_s00_season": False,
+            "max_workers": 8,
             "clear": False,
             "no_exist_action": NoExistAction.ONLY_HISTORY.value,
             "save_path_replaces": "",
@@ -1537,325 +1969,195 @@ class GetMissingEpisodes(_PluginBase):
             "whitelist_librarys": [],
         }
 
-    def __get_action_buttons_content(self, unique: str | None, status: str, skip: bool = False):
-        if not unique:
-            return []
-            
-        action_buttons = {
-            "add_subscribe_history": {
-                "component": "VBtn",
-                "props": {
-                    "class": "text-primary",
-                    "variant": "tonal",
-                    "style": "height: 100%; width: 100%; flex: 1;",
-                },
-                "events": {
-                    "click": {
-                        "api": "plugin/GetMissingEpisodes/add_subscribe_history",
-                        "method": "get",
-                        "params": {
-                            "key": f"{unique}",
-                            "apikey": settings.API_TOKEN,
-                        },
-                    }
-                },
-                "text": "订阅缺失",
-            },
-            "set_all_exist_history": {
-                "component": "VBtn",
-                "props": {
-                    "class": "text-success",
-                    "style": "height: 100%; width: 100%; flex: 1;",
-                    "variant": "tonal",
-                },
-                "events": {
-                    "click": {
-                        "api": "plugin/GetMissingEpisodes/set_all_exist_history",
-                        "method": "get",
-                        "params": {
-                            "key": f"{unique}",
-                            "apikey": settings.API_TOKEN,
-                        },
-                    }
-                },
-                "text": "标记存在",
-            },
-            "toggle_skip_history": {
-                "component": "VBtn",
-                "props": {
-                    "class": "text-warning",
-                    "style": "height: 100%; width: 100%; flex: 1;",
-                    "variant": "tonal",
-                },
-                "events": {
-                    "click": {
-                        "api": "plugin/GetMissingEpisodes/toggle_skip_history",
-                        "method": "get",
-                        "params": {
-                            "key": f"{unique}",
-                            "apikey": settings.API_TOKEN,
-                        },
-                    }
-                },
-                "text": "取消跳过" if skip else "跳过",
-            },
-            "delete_history": {
-                "component": "VBtn",
-                "props": {
-                    "class": "text-error",
-                    "style": "height: 100%; width: 100%; flex: 1;",
-                    "variant": "tonal",
-                },
-                "events": {
-                    "click": {
-                        "api": "plugin/GetMissingEpisodes/delete_history",
-                        "method": "get",
-                        "params": {
-                            "key": f"{unique}",
-                            "apikey": settings.API_TOKEN,
-                        },
-                    }
-                },
-                "text": "删除记录",
+    @staticmethod
+    def __build_action_button(name: str, params: dict, skip: bool = False) -> dict:
+        """
+        按模板生成单个操作按钮
+        """
+        props, text = ACTION_BUTTONS[name]
+        if name == "toggle_skip_history" and skip:
+            text = "取消跳过"
+        return {
+            "component": "VBtn",
+            "props": props,
+            "events": {
+                "click": {
+                    "api": f"plugin/GetMissingEpisodes/{name}",
+                    "method": "get",
+                    "params": params,
+                }
             },
+            "text": text,
         }
 
-        action_names = {
-            HistoryStatus.NO_EXIST.value: [
-                "delete_history",
-                "set_all_exist_history",
-                "add_subscribe_history",
-                "toggle_skip_history",
-            ],
-            HistoryStatus.ADDED_RSS.value: [
-                "delete_history",
-                "set_all_exist_history",
-                "toggle_skip_history",
-            ],
-            HistoryStatus.ALL_EXIST.value: [
-                "delete_history",
-                "toggle_skip_history",
-            ],
-            HistoryStatus.FAILED.value: [
-                "delete_history",
-                "toggle_skip_history",
-            ],
-        }.get(status, ["delete_history", "toggle_skip_history"])
-
+    def __get_action_buttons_content(self, unique: str | None, status: str, skip: bool = False, apikey: str = ""):
+        if not unique:
+            return []
+            
+        # 同一记录的按钮共用一份请求参数
+        params = {"key": unique, "apikey": apikey or settings.API_TOKEN}
+        action_names = ACTION_NAMES_BY_STATUS.get(status, DEFAULT_ACTION_NAMES)
         action_buttons_list = [
-            action_buttons.get(name)
+            self.__build_action_button(name, params, skip)
             for name in action_names
-            if action_buttons.get(name) is not None
         ]
 
         return action_buttons_list
 
-    def __get_history_post_content(self, history: ExtendedHistoryDetail):
+    def __get_history_post_content(
+        self, unique: str | None, history: HistoryDetail, link_prefix: str = "", apikey: str = ""
+    ):
         def __count_seasons_episodes(seasons_episodes_info: Dict[str, GetMissingEpisodesInfo]):
-            seasons_episodes_info = seasons_episodes_info or {}
-            seasons_count = len(seasons_episodes_info.keys())
-            episodes_count = 0
-            for season in seasons_episodes_info.values():
-                episode_no_exist = season.get("episode_no_exist")
-                if episode_no_exist:
-                    episodes_count += len(episode_no_exist)
-                else:
-                    episodes_count += season.get("episode_total", 0)
-            return seasons_count, episodes_count
+            if not seasons_episodes_info:
+                return 0, 0
+            # 有缺失集列表时按列表计数，否则整季缺失按总集数计数
+            episodes_count = sum(
+                len(episode_no_exist)
+                if (episode_no_exist := season.get("episode_no_exist"))
+                else season.get("episode_total", 0)
+                for season in seasons_episodes_info.values()
+            )
+            return len(seasons_episodes_info), episodes_count
 
         history = history or {}
+        apikey = apikey or settings.API_TOKEN
         time_str = history.get("last_check")
         skip_status = history.get("skip", False)
+        exist_status = history.get("exist_status")
 
         tv_no_exist_info: TvNoExistInfo = history.get("tv_no_exist_info") or {}
-        title = tv_no_exist_info.get("title", "未知")
-        year = tv_no_exist_info.get("year", "未知")
-        tmdbid = tv_no_exist_info.get("tmdbid", 0)
-        poster = tv_no_exist_info.get("poster_path", default_poster_path)
-        vote = tv_no_exist_info.get("vote_average", 0.0)
-        last_air_date = tv_no_exist_info.get("last_air_date", "未知")
-        season_episode_no_exist_info = tv_no_exist_info.get("season_episode_no_exist_info", {})
-        status_cn = tv_no_exist_info.get("status_cn", "未知状态")
+        season_no_exist_count, episode_no_exist_count = __count_seasons_episodes(
+            tv_no_exist_info.get("season_episode_no_exist_info")
+        )
 
-        season_no_exist_count, episode_no_exist_count = __count_seasons_episodes(season_episode_no_exist_info)
+        # 记录未变化时直接返回缓存的卡片；每次检测都会刷新完整检查时间，剧集信息随之更新
+        cache_key = (
+            unique,
+            history.get("last_check_full"),
+            time_str,
+            exist_status,
+            skip_status,
+            season_no_exist_count,
+            episode_no_exist_count,
+            link_prefix,
+            apikey,
+        )
+        with self._lock:
+            cached_component = self._post_cache.get(cache_key)
+            if cached_component is not None:
+                self._post_cache.move_to_end(cache_key)
+                return cached_component
+
+        title, year, tmdbid, poster, vote, last_air_date, status_cn = (
+            tv_no_exist_info.get(field, default) for field, default in CARD_TV_FIELDS
+        )
 
-        _status = history.get("exist_status") or HistoryStatus.UNKNOW.value
+        _status = exist_status or HISTORY_STATUS_UNKNOW
         status = _status
-        if status == HistoryStatus.NO_EXIST.value:
+        if status == HISTORY_STATUS_NO_EXIST:
             status = f"缺失{season_no_exist_count}季, {episode_no_exist_count}集"
         
         # 如果被跳过，在状态中显示
         if skip_status:
             status = f"{status}⏭️"
 
-        mp_domain = settings.MP_DOMAIN()
-        link = f"#/media?mediaid=tmdb:{tmdbid}&type={MediaType.TV.value}"
-        if mp_domain:
-            if mp_domain.endswith("/"):
-                link = f"{mp_domain}{link}"
-            else:
-                link = f"{mp_domain}/{link}"
-
-        unique = history.get("unique")
-
         if tmdbid and tmdbid != 0:
-            href = f"{link}"
+            href = f"{link_prefix}#/media?mediaid=tmdb:{tmdbid}&type={TV_TYPE_VALUE}"
         else:
             href = "#"
 
-        action_buttons_content = self.__get_action_buttons_content(unique, _status, skip_status)
+        action_buttons_content = self.__get_action_buttons_content(unique, _status, skip_status, apikey)
+
+        text_rows = [
+            {
+                "component": "VCardText",
+                "props": CARD_TEXT_FIRST_ROW_PROPS if index == 0 else CARD_TEXT_ROW_PROPS,
+                "text": f"{label}: {value}",
+            }
+            for index, (label, value) in enumerate((
+                ("本地状态", status),
+                ("剧集状态", status_cn),
+                ("开播年份", year),
+                ("TMDB评分", vote),
+                ("检查时间", time_str),
+                ("最后播出", last_air_date),
+            ))
+        ]
 
         component = {
             "component": "VCard",
-            "props": {
-                "variant": "tonal",
-                "style": "width: 320px; min-height: 240px;",
-                "class": "history-card",
-            },
+            "props": CARD_PROPS,
             "content": [
                 {
                     "component": "div",
-                    "props": {"class": "flex flex-row"},
+                    "props": CARD_BODY_PROPS,
                     "content": [
                         {
                             "component": "VImg",
-                            "props": {
-                                "src": poster,
-                                "height": 240,
-                                "width": 160,
-                                "aspect-ratio": "2/3",
-                                "class": "object-cover shadow ring-gray-500 max-w-40",
-                                "cover": True,
-                                "transition": True,
-                                "lazy-src": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAKAAAADwCAYAAACHQW/aAAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAAIMJJREFUeJztnXmUVNWdx605J3Myc+Zk9I85OScnC8S4B0WJRlywQdDGsBTtkri3Go2i9AI0O1TRQDdLLyoigoZWEVFRcckybvTMGGM0BiY60Rihih2apQposLur4d25+73vVXXTr+q+qve6f99zfuftRfWtD7/f7953l1NOAYFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAjkc21aj07d9HvUD2+JnVro7wPqA/rsHVT08Suo6b+aUPKtpQj9rhGh3zYg9PtHEHr3CRT/w2rU9OE6VFTo7wnqZSLg/eE51PxaLUJrpnRvr85D6L2VKPb+agARlKM2NaN+n7yGml/vAXhOI89gEJuam1C/Qv8doIAJg3fqpjdR5O3HUfKFme7h0+2Nxch6bzmKYBAhTwSdXJ++jUpJjpcreLq9MAN7xEUo9tbj6M5C/30gn2qTizwvW1uLQXyzHsXWN0JYBnGRPO+jl9HTv3vYO/Cctm4OQusXoKb1UQCxz8pknpetvTQHWeurUaTQZQHKsz59C4XffxbF10UKA55uz0+lOWLsxZmQH/Z6iTwvm2aVPMG4sWkahOVeJxpuf4Ma33qs8JD1yKpQE4DYS/TZO4XN83KwGEAYYJFw+8e1/sjzcvCEqwpdjiCXIs0qf37N2/a8PFqi0OUJ6qECl+f1zKxClyuoB/rsXVT+3pOBzPMAwCCL5HkfrEGbSBcoH8ACAPYV0Txvfa/J8wDAoIh0ff+LeH02o+BwAIB9STLP6xvgAYB+EX19trpPhFsA0E8iI84+Xo/Wv7mk4BAAgH1JNM97vU/leQCgX0S6wzf/GsVJh00f/Ph+MAAwHyJ53vt9N88DAAslEm43vo6eJgO8ffBj+9EAQC+k53lrA5znPTcFJYkBgAESfX32fHDzvOeqUPOaKlTaVKHG+ZJ9co5eCxiAH69PXfjW0hObfrPkxMZPXu3FwwI2vY0GfvBCoPO8+OpJJ59ug4BI7g0CgK/VHg9hi9eP60DEnrg7hZqfsjZ+uLYXdYSl4fYN1PifSwsOUFZGQuzqKhR1+3evnoKiBkD0FMCXo50hbEgAKOzZiZ3o7WUngj+tyF/fRuXvrQxwnjcVPayHWrdaOxX1wwA/7VcA10U6Q9jSACT22G0ptKbqePz91QEcNrrp9yzPeynAeV5Pwm1PhUHsjz9zU5AAlCDemkIvRY7H/ntVAPJD+vrslWDnec9PQWGvyieL/NBTAF+a3RnC1i2Awp4uS6Hf1R9/tXm5D8OyaFZ5Z3nBAcrO4/E8L5dw60Y8PwwUgDI/rEyhNxbj/NAvIJI8791g53lNJFfLd7n1MD/0FMAXZ3WGsLkCkNjSWzrQ2mnHY+8WcrYvkufR12c1PoAoG69nOM/LViQ/XNN1WPYlgMIevbkDvRI9HnuzsbPIy+9pEwm3f1qHGoPaTYqEW5zn+S6h7iI/jHn5b744EwM4M3sAhT31QAq9Un28yfNp50gl44M1KB7EcJvvPC8bke8m8kP8fRPYKrz8916Y0RnCljOAwhu+OPO4d3MfEvg2rDTWwp9f+HC4LUSel4vy8R/FJIDC1lRhCKMefPeP1gXP8/klz/Or1k7vDGEzCmDjDR1o3ezODUa/6CdvoNKXZhceqB6Dx3qpeBq+eoO8AJDYsjtS1ivzU+bK/93lwQm9fs/z/KS10zCA08wDSOyZ8k4z89p88jIKvzq/8GD1JNwGLc8rtJ6f2hnC5gmAy25PWeuiBppn/vB8Ti/T82E96iYFSpeXABLDFZzGnL/kO8uNd7I04/Egz8tZa6Z0hrB5BmDTQ6mNOX/J3zZ62uU8O8uxmxSIaU0VBrDKOwCf+lUq9zzwzTofACe8HusOP9BA2YNO8R7AJ+9L5f4q8Y3FhQdvDeR5nui5yZ0hbJ4BuPJeAwC+vqiAHi8Ar8+CrEAAWLDOpR7neRUD40WTBsbLpwzc7FkHVL9r9aTOEDbPAFzxSwMArs9zd6t8vD6bfNG2yKQL44hZjGzjUwfG+3n5b/pRqydiACd6COA9BgDMVyP0M5Unko/ffdTzZpWqgfGBBLzJCj40aWCM2QXxpoo+BOKzlZ0hbP4G8JVqb8F7tvIEarjpUHLBdfvyUrutumhz6eSLGHyTNfgmXkAAZDbx/HjwRoJlIa8BfOJuAwC+PNc7+B69rRXNuGynhYHIW4Ny1UXxUuX14hI+ZlswfDFmF8Tik86P+67jqkk9W4EBrPAQwLsMAOjFSkNP3NuG5g7fi6oGbSXmaa9fpyYO3FxKwXN4wEkXaCCev0XapAGx5oqze2dYfgYD+IyHAC43AaDJblgk3NaOOkDBmzxoq1X1k61oyqBtefUyFMALYwo8LQQL71eJwavkAFYOYFYxYEtTbwPxmfJUCJt3AJYaAPDFWWbAq7/xEJr20+0Yvm0YvG3WlJ9sY/sXx/P6ZqNKeMBM8F2wxeb9qA1gVvnjzQTEeMV5X/Wa989Pl6VCZLyvrwHMdZrcFTjczrxiJyLQUY+HwaPw4X1iBsrRlUglxAYegU5YBs9XOWAzgw9bxXlyG688b3Pg80OvAXz8TgMArp2eHXhPje9Ac0e0WFMu3oaEx6N2sWb42EA5uhLLARV8k2x5X0zCJ7xf5Y8VhARA7AH1baDD8tMTMIATvAOQ9IzO+UuSJeVdhduJFloyLoGmXrwdA7bdolsNOuexgXJ0JQFgWu1Xht9YRu+nAMT7ZHsuBvBcvj3vq8Yggtj0UCqEzTsAb+/IHUBXzSo3H7GmD95BIROgiX1qlzBj8G23CKAGytGVqjQPOCkNPhV6JwoINQArhefT4cNWfg7enhO8sNxrAFxxXxuaPWSXDTQC2NSLd1js3A6LAkfOXWIH0kA5uhIBUPd8k7RmF+X5FHgVugc8l3tBHTyyfw6z8nP+gcrP/kes4ox/BKLL2KoHUyFsngH42G0eA9hU1omqr2lBEiru4aZdsoOaOJbnf7qDmn7OQDm6kgDQVgnRAKRbVuPNVPnQwm9G+HTD+eEX/fL997nRqvEYwPEBBJDkeQ03HeaQCaB2WAy+nZYOGtuSazssta+ANFCOrqQqIemh11np0PM+aV3BxwGkx2ex/bIzv7TKzvzKt6/1vAZw6a0eALjivnY0+6rdSAB1MiOAZtoXZqAcXWmiHoIdbX4UPEfFo9JW8XDmfener+wsYl+q7ZkUxFjZmf7LD3/9QCqEzTsAbzEM4LI7j6Lpl+50QLTTYueE59O3jnu1Z6fi6wRiA+XoSuO/+WGp/b2v1uQywNnkogBUlQ+V+xHwKIBnO8LvWRzEM7+UNuGMv6OyM/6+8f5+/gnLgQJwJfZ8BCgCm9MIUDqYdF8eMyBt92v7BsrRle4/5X9KJ3z7rw7Pp8O3JUPo/Sot9JZL455P84A6gBPO4BDi7YQf/R099MMv0IM//KLJDyA+dX8qhM0zAB+92RCATWXH0Zyr9jBoBu9CwuPpQCnwFGwz8L34mrqPeUXbsYFydCUC4P2nfIAe+Oc/oQnf/T/2qu389DY/lQN+ldEDUjtb2Mm9H4FvwukYwP4YwP6fo/H9Po8/8P3PC/pa76lfYQB/5SGAvzAE4KKxCQ7VLivNAw7O4BEJdIPJNv1+BSC5tqtgAAp78FufoAoMDsv/tshmF1XpSK98ZKjx2nNADT4K4I8YgA8S70cA7IcB/AG27/8NzbmsJdYQThUkP3wSA/ik3wEk3o/CMph6P4t4tRncC9LtYA7ZYN3YPfy6vF8+w8Ek+wbK0ZWcAEoQT9uIvdeXWpPLVzT/cza7lHfd7MIB/DLd+53OQi8Nvxy+BzB847/3NzR5QJz9YCWppsZwW798lsWT92EA7/MOwEd+bgDAZXcek+BNV1BZ+lZcY7ZTwsdst8XOiy2/5zK2NVCOrtQVgDQsf+NPqAyHZRZuN6utnvuJsOusfMjc70sJ4QSR93EAifejnu8Hf6Peb/z3cApwzhb7D1eSaswXiCsxgCs9BPDhmwwASPrvEVgITDMv2833d0vw6LFm6h5yvJuZ3FefQ4xAaaAcXak7AG0gYjhsFY9zM3u+srPSPR8BkXo+AuDpygMS70c9IIbvAfz5ZH/hdUcz/Xh5Ccsr78UA3utzAKuH77ckYBiYmQIqARTfn6kdz9QsE6DyM3wKoAzLp/4FlWEPpioevMH5HHvlQ+Z9evjl3m/C6V/Qigex8QRA7v2mXbQdLRnTdrIfMbY4nPLstd6KX6ZC2LwD8EYDAM4espdBczk3AZfjeAY/h7eW2Gf37cHn9li2ZzQzUI6u5AZAYQ/9x/+icgLiOQ7oNCvvoubLQu/nzDB8VRfEsNc7hBqud/FjepQfrrgHA3iPdwA23mAAQAUahghvZ2GgdIDYcdeAMSj3WDP48xxQi4BJnjFQjq6UDYAiLE/4zqfUAzrhcwIo4Tud13qxVWJ4l4xNkpphtj+o1VDSafS1XiAA5IAxyDiIs64Q5wRkezJuxX32+/VzwQHQlh9ib2ZvdE5vdiHwEe9Xga/VjNyLlt7ajhpKjPywxvLDJ+5OhcgSrV4BiL28GQAFLGSrjvdaAqRZeJ9DZumASQC5iev6eQPl6Eq5Aihs/L/j/BBDxt/12mq+tNaLr80fsQs9eV+7u3DbQ6sb17Ex17AcDACv0GFioNnPEY+4F9nP781wzvk55PrewAJI7Z/+iCbgvM4ZeiNDtqHldx0h09R69uNKyyE/XH5XKoTNOwBLjAAoQOLbK/dqkDGgZvNzs6/c64CQbdl5sVUgkuOcv6BLGQWQeMJ/+VgCOGXQFtRU1opWeNi00YXF68Ptrl/rLS/FAJZ6+l0N1IIZPBS82dwETN3ZLOdxF8/k/AVdyjSAD3zjQzRpwFfosTv2oafLaNtXvuFT5hLCYAA4pMUBTYtFzs1JO6/D16Jg4/fazuF9dtwSeAAfHR1HL81JoUduyrvXy2SupsR9/M5UCJvPAcSQMAj3WQrGFoc308+32EGkz9jPy2eGBBfA6gGfodUTksjL7kwA4CnMA86RHq/FmqMd03ND9llqv0V6SNtzjn16fNU+epzzF3SpXAGc/O1P0Kuzk+hZD+fVy9pKUqvclMWyOzpC2PwNoABFwMaAY9BhkDh8+9LAnCMgk8/bnxXbnL+gS2ULYNm/foQeC29Dz09pQ4/83Fdej1pduL25MexuRtllt2MAbw8QgHKfguUATOynWQuK4G2E3xdxXMv5C7pUNgA2XrMFvTSzwy95ntPiS8JtRdmUxbLbMIC3+RxACYzwXmKfQyWuR05yTCx61X5Lh5Ncy/kLupQbAGed8Rl66q4E8rLHSA6WXJJF04uuxzCAj/kdwDkYmmjRfgoP3WKjYBXtQ+KY3EPORYts0FniWXJvRHwGuZcfE8v5C7pUTwCsPO0T9Ot7EsjLtwS5GA63D7sNt5kUCAAVcPslcHR/KAOKwbRPnqcwavfpz4n7xT65N+cv6FLdAfjQNz9Ci4ZsRU/+sg013lh40Jw/JgZvQ2P4qLHuWUtv7Qhh8z+AUQFc0QGLWMThEeU5J3C2Zx0AczNQjq7UFYDzfrIZrbjra7rgsg9gc1os2zyvOy29BQN4i+8BxNAN1UAaqqCTNlS/dsBS18k5cv2Aeka/Z2jhAaz6zqeoYdRB5PEPka0lMHhRE+E2k5bejAG82e8AMoA4ZAc4aGnHHK4DdH/uMGbiHN2X9x6U95HrBsrRlQSAZf/2Z1RXfJAMnCk0ZBl/ONKm5xV4Qo9iAB/1O4AUHgmQZvKcBhTel/A579eu6Z9poBxdqeJbfymddV6cgmeof57RH4zkeV6E20x69BcYwOw7yObPAypwMGzDOHTDBFQHKUxzuzAGKL7v6oPyWL9uoBxdqb6krbTef+ARS+R7fDD+TxjyOAKY8IAHKXgEoOgwBpx+ju0fYNfIMQdN3cfAJfvV7H6r+mr1GQbK0ZXqwxjAwsNmA8/LPK87BQLAaglVwpIwyXM6kAfQ3KszwMmBrNaPxefhrYFydCUfAcibVfI7GF3Xwzd1hDzuPmbAA17NQGEgJiy5HZ5AAs5qaglm+Lw6d5Aei3vl9moFooFydCUfAGjVjUttzFee150evhED6G17pwkPqMMjACNQMhjFsQKUn9fBHJ6wg0jvSdL7DJSjKxUSwAYabnN7fWZSwQDQBg8FTPNoSct2XbN59mcobPPk+aQ1j3+GgXJ0pYIAWNJhNYxrbyxEntedGm/oCHnc8J47gAIaAY6ERx6r605T1/AzI5LpcGIzUI6ulGcArcbrC5vndadgAIjB0SES2/lkX1zj+xTOEYcs9Qx7rlp7Rj43gp0zUI6ulC8AG67viDXeUPg8rzvh7xjyYsioYQ+oA3fIDh/Zv+aQ3NdNQKfb/PT7el0zTENJR6K+pC2a778rG+HvGvK4Md6QB+SgzRdbCt0hAZg1/xo7YAJWJ3Ds2SQzfs5AObqShwD6Ms/rTjg3DXncKJ87gBgaDhjbCgCV8dB6jW6HLQmsgJEey8+wxL0GytGVPAAwr6/PTAp/95CX0cCQB6TwMIAEWMro8YJr7efEMdkuuPYwv++wZb+PHRsoR1cyDGCsLtwRzvffYEqBAFCAIkzBc5jtX4uhdIDFjtk9aTBeK86zawbK0ZUMAViw12cmFQgABSgCIAWR8mIKqkPIvrWfs0MZSA/Iu0n5s1nFraoGbr3Q9wDWFNtBEsc1xUcyeDR2TO+h9x2xXZPPs8+g1wyUoytlCWBg87zuVDUoflcAAGSg1Yw8YgOPwFUjIcMmwCrWIct0Xrsfbw2UoytlAWDeu0nlQ1WDtoamDNra7HsACTA1BJpiBo2ASG4xmATKmmIGJz3WzvHnUa1+Xl4/4mcP2CvyvK40ZVB8HFmx3vcASqCotVLgKEwMOAxXq2UDT4Fmccgs5/PUm/JnDZSlK/UAwIJ3k/JaUwfG+2MPGA8EgLUjW+3gUbjIcavlhK7Wtt8qz9WmAdyKxOcaKE9XInlcd+D1tjzPqaqB8QunXLItTletDwSA12FYhBF4rmPgMLAEiPjYed9Isa+ek+e0ewyUqWvVj0ttIIUjCqneZ92kvFDFwPipUy/e3khWKGWr2W8nAFoBAPAohWuhBpjYX/izo/wcvmekumYDUkJH77EW0nuOys8yULZZiYTiJSWpVQ3h9vLemucJzfjp7nIMXnIaXSKXr25PALw4IB6QAjfyKIOHQsehxPsLOVwKxnQ4F2YAd2GBAewLmnbpjqLpg3dusi8gvl1uMYT+94AUFgdo6hwBUZmCU92X9oy0Y/S8gXIGOTTt0j39pw/e3SyWRiOLQ/IV65kHFBYcAI/1AKjMkNnul/vH5NZAeYO4Korip864bE8EW0IuIGlbq5ktIK5D6HsAF486mlw0SkGj7+tgqmt2DyfOMzumHbN9A+UOwsLQlc68HIPH1+cT6/TJpXZtq9jvCA6Ai352LL6QQ0egYXbUsVXnJYijxP1sP/0zmBko+z6r2VfuDc26YsfQWVfsaVYrU+1OW9WUwbfLUl5QhWMvASSL6eT8R2JomhRMXdnXFvNo+L7R3d13DMn7AMCcFCna0x8D2ESW0JDrr1zuAPAyukazpS8YLr3gJRRCbz2gyzmrM6p2VGuRhGy0Am7x6K8ROaZbBpOl7dvuEYDq95MtMQO/RZ9SpGjraXOGtERmD9mfECsP2Feh0haJ1NZ1FmFYVEiEeRl+jTTqN4aTpy4ecywhYFoyRoHHYBKgEUDJPgMt/R51zKzNIudz/0n6hqJF+0ORov1DI1fti7PJ4rXlMK5oUUuo8VVI2aqku5BeE57uCMPYC3pZC44Z++MxWBUEGGYMOAERP6fAGpPBtOtkkWb9XmNfspcqOuxgCMM3FFuzmq9bXxZDrkRlD8OXa+s3D9aaYy7daem1Yq+8X0M4dYfRglgyum0D8X4UoDTAMIR8n13nUNJz5BoD1fksOTb6JXuZokXJ0zCAjWpubm2Sd9v6LcwL8kUg1cqldJ3m3Tj88sqIDMM7vQ3BJR2vGi+M2nBbPwxSjEAjjIGnwFoyVl3r6pwENI8A1rOu56F8/FsmNBd7vXlXH6yIDj2Q1GeljRRpqw5oa62Itfj0RSX52sxWWigeTCsiloDQi9DrWU8iAiEGKkahomC1W2qfgUj2FZRt+nUk98eqa558UU0N1x+/ExdKsp6tKFnpZxDnDU+EosOTQzGAcfv8imp6Y7XmStoKVbZQzNZz3q1qxQ4vSELwdGwmwy6ZdMnzbmykUoLBWYVNwlUXbudgMSDrxrYrKMdqkEpQ2y3xjKdf9hTq/eKOgorj/KS0viTlKxCjxcn+GMBmNR2ec6ZZNbe2bQ0WfXm0KxV8apV6tki48ILTB7P2QcMekNR4I3nt1FEXPhZm3rD9BIGJ2th2DmO7DU4GpIJTHJNrXn/PrvMUutBzf6///ZOJ5HnVw5NR25w7av5FO4i25S8cFRL70rj2JhmeC84YrDdO76IQ5uz1wu0b8HcqKlgBLibdmsLtMR00tt9hyX2H1Yc7qBUUQG4NJZ2k2/1pXn8Pp+aPOBRaMCJZMX9EMikmbhIAahOA0plnbXN0a17Qtg6ftoqp3iwzU2ucVm9IVCjO2uONbUtUDztYnu9yyyiSG2KYGrFlBK4u3GGlH/sDQD0s1+UhP6y59khoXnFyKAawWcwsoebTSdgn8ZQz0Gr5oPCAjmXQpBfUvKEMxdQDklqx3ji9m74jdgsfTb1wuCUdXL0uK9eilZRwx6p6Dhz5wgI46vW0P0TA6PV3clO4GMBNJCx7lR/W4jwPA7iejAZUs0wcts065pxRVs7BLdZbGaoW+mHw8aYZWyim6zPL5hibJ7xceUFsbioh1sKRrTjc7unnRdkYFR34g8Nyver2zi1lMfjYeSMvq0/2XbIJMYbzQ5Ln1RS3RmuKjyTYcFQxZclhOd+OPq2dNiEom42We0K5JAYD0IrY1ubjy+nawrB6TTeTe0DlBXfTvLAn4C0a87UnKzV5rrpwqryezZ+S9j+NnMvHeNscEmxWW84hLNeObA3VjDwyrnbkkXgNH0koxkSr2SXY/DocQAWhnPbYXhmR3rBItQ2SHFBCyBcVZyvWO96QiDDMa8TkmW4jAs7zlow+6o88L1uRdiHs6Zq4N1RW0hHNx7+fA4ASRPy/f6ibsLxo9NFQbXHrUAxgsxjExUYSsrHQC4rts0U4c8F5eggWIPKlL9TSZ3y1Kr5SKQ3F2or0pF1w1pXCC+61WLvgHvF6jnpB8vld5XmLxxwN1FRzJxUBsWFcx1gSnvP5hxkA0FVYjo5NnoYBbBS9wcUYGQkhH5Bvh08BKKaz0+ff1pa/cKxapXlB3jid3lFBC8OsTdAStWLSd9MZbkmzyuIRSWMrcvZ5GQOQG2u2aevfMC4VwjltaMnottDi0V+HGsPJ0xaPaosuGnUs4RxHU8uHseozQrApSrRZxhSEdGLPtBqxqhnb4GO54H5bw7RsnFYQUk/IG6apFyTndfCWjG0PZp7nd5kGUII4LrUJA9iMAWzGAMYX8V5CtPe3GI7gHC3IB+uzeXb4HDlOTzjCHopx7VgLxwftYVhUSHgYjtiaZFocbYPqrQgx8p+A/y2JRWOORch4kkL/Vr1SXgEo8yWt44Xo96iPfekKQEcuKOZYlBUSsSJBtV4hGZYWikVlRLYPinbB2ZnDMW2SIZ/FvF6b5yty9nnlDUDR+5sBaDkHbOmzRKi5cbTZw7gXFBN62ioktld0bMk0tUqpvhD4Pp4PkgrJPu39sPCCe1FkyL4T2Fv3+ilIfKN8ekDVA1wf/6JGCJJ8UM2p02rVFKv5FvXZZJ1hOPMbEseyuVrboPKCLbxdkIJIrsUw9GY7ioK6l9cA1o21A+gclKXDJ42H4gUODyhmjlUrEYjlLvSVp+xtg1FnuyB9MyI6rrLGaewNE9gLzoFwWwB57gGdnXD5GBg1UlB4wGNp05fUFGuTfBY7vGDa2xFtWTSty5ZakV70krF1XD0RubLl1eilAXh91luVXwDFOBmVDwr4Ms2f00WFRJsQXlsIaLjDC9oqI3o+eICEWuIRyXvbokKXf5+X5yFY7/+oDcKiowS1oayiVpzeOH1Enzfb5gXlylTXKAD5iqSZOq2SNyMYvAMJDGCwX5/1JuUDQNUDvN2SA7K0fJC1DWpz69jmUmy1TWlcI2vEh7U1WLTlzxxhOKoqJInIsP2RKLTn+Ut5ATDcroYlyHEx2phpW43YGYbFO2J99YAjlj0XzNBdS67bjMPv1QeC0U2qL8p7AHln27HttnyQDry3zxyBFuoTO13naBss1l7T6XmgY6FILRSfmDs8sbGg3eFBJ1e+PKB9xN/XcuipygfZFCXpNeKj9rm2BYDFmZpl+LK5w5OJ+cOTvXpK4V4jrwHU80A5KMsxOF/Mj2N7O6LNGCvm3FYdFdQCQI53xMQLNkaLkpDnBUX1bEywlyFYDjtgtWFWI1azQTAPmCkXlD1mRvI5tkdqPWWK9eaYQ+Rd8YZocbJfocsT5FIYjofz5gXDjmGp2lQk+huStPfEI7XJ3OUaK7RCcgLbFhxyiwpdjqAsRTrCYkBi3sHHxrnUh9PzQdu8OVouqFdG5Jza19kAxGH5cAJDGCl0+YEMiA4LCLc11acNkvIuH7RNSaJmBLPEqzr7vNu2dkFSKWmAPK8Xio1PsS1SYyoPtNLDsH1OHJkPau+JVX9B+naE5IEbFoxsvarQ5QTyWHy9OENhOWUpENXMD/qbET0cs4k8xfzabI7t2p8d24K9XmBXXgdlKbIaJgYnYTL8ZsoF9Vqx/nYE54KJ2lGt0WgRdJPqszKbH6bsoVhMyjSmXfOCIhdsW1Vb3HtX5AS5lFZbdgmiCsENJSktFHdYaiYw2SRj0ZlmR0F3eFAXMpUf1oVVWKZT2I1tT9T1wpXXQR6IdF3n+aELb6hVRmyVko6D2CJR6A4Pcque5IeqCabDcpzr9Suvg/IkMoSx+/ZD6f343DcpGPYIMq9GOv9hW5TDmFDAkTDbvoGEWgAPlDeRXBGGOoJAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgUFP0/6pF8BCysaRUAAAAASUVORK5CYII=",
-                            },
+                            "props": {"src": poster, **CARD_POSTER_PROPS},
                         },
                         {
                             "component": "div",
-                            "props": {
-                                "class": "flex flex-col",
-                                "style": "width: 160px;",
-                            },
+                            "props": CARD_INFO_PROPS,
                             "content": [
                                 {
                                     "component": "VCardTitle",
-                                    "props": {
-                                        "class": "pt-6 pl-4 pr-4 text-lg",
-                                        "style": "word-break: break-word; white-space: normal; line-height: 1.2;",
-                                    },
+                                    "props": CARD_TITLE_PROPS,
                                     "content": [
                                         {
                                             "component": "a",
-                                            "props": {
-                                                "href": f"{href}",
-                                                "target": "_blank",
-                                                "style": "text-decoration: none; color: inherit;",
-                                            },
+                                            "props": {"href": href, **CARD_LINK_PROPS},
                                             "text": title,
                                         }
                                     ],
                                 },
-                                {
-                                    "component": "VCardText",
-                                    "props": {
-                                        "class": "pa-0 pl-4 pr-4 pb-1 whitespace-nowrap"
-                                    },
-                                    "text": f"本地状态: {status}",
-                                },
-                                {
-                                    "component": "VCardText",
-                                    "props": {
-                                        "class": "pa-0 pl-4 pr-4 py-1 whitespace-nowrap"
-                                    },
-                                    "text": f"剧集状态: {status_cn}",
-                                },
-                                {
-                                    "component": "VCardText",
-                                    "props": {
-                                        "class": "pa-0 pl-4 pr-4 py-1 whitespace-nowrap"
-                                    },
-                                    "text": f"开播年份: {year}",
-                                },
-                                {
-                                    "component": "VCardText",
-                                    "props": {
-                                        "class": "pa-0 pl-4 pr-4 py-1 whitespace-nowrap"
-                                    },
-                                    "text": f"TMDB评分: {vote}",
-                                },
-                                {
-                                    "component": "VCardText",
-                                    "props": {
-                                        "class": "pa-0 pl-4 pr-4 py-1 whitespace-nowrap"
-                                    },
-                                    "text": f"检查时间: {time_str}",
-                                },
-                                {
-                                    "component": "VCardText",
-                                    "props": {
-                                        "class": "pa-0 pl-4 pr-4 py-1 whitespace-nowrap"
-                                    },
-                                    "text": f"最后播出: {last_air_date}",
-                                },
+                                *text_rows,
                             ],
                         },
                     ],
                 },
                 {
                     "component": "VBtnToggle",
-                    "props": {
-                        "class": "d-flex mt-auto",
-                        "style": "width: 100%; display: flex;",
-                        "variant": "tonal",
-                        "rounded": "0",
-                    },
+                    "props": CARD_ACTIONS_PROPS,
                     "content": action_buttons_content,
                 },
             ],
         }
 
+        with self._lock:
+            self._post_cache[cache_key] = component
+            if len(self._post_cache) > POST_CACHE_SIZE:
+                self._post_cache.popitem(last=False)
+
         return component
 
-    def __get_historys_posts_content(self, historys: List[ExtendedHistoryDetail] | None):
-        posts_content = []
+    def __get_historys_posts_content(self, historys: List[HistoryEntry] | None, current_history_type: str):
         if not historys:
-            posts_content = [
-                {
-                    "component": "div",
-                    "text": "暂无数据",
-                    "props": {
-                        "class": "text-start",
-                    },
-                }
-            ]
+            posts_content = [HISTORYS_EMPTY_CONTENT]
         else:
-            for history in historys:
-                posts_content.append(self.__get_history_post_content(history))
+            # 媒体详情链接前缀和API令牌每次渲染只读取一次
+            mp_domain = settings.MP_DOMAIN()
+            link_prefix = f"{mp_domain.rstrip('/')}/" if mp_domain else ""
+            apikey = settings.API_TOKEN
+            build_post = self.__get_history_post_content
+            posts_content = [build_post(unique, history, link_prefix, apikey) for unique, history, _, _ in historys]
 
-        # 获取当前历史数据类型的显示名称
-        history_type_display = self._current_history_type
-        
         component = {
             "component": "div",
             "content": [
                 {
                     "component": "VCardTitle",
-                    "props": {
-                        "class": "pt-8 pb-2 px-0 text-base whitespace-nowrap text-center",
-                    },
+                    "props": HISTORYS_TITLE_PROPS,
                     "content": [
                         {
                             "component": "span",
-                            "text": f"··· {history_type_display} ···",
+                            "text": f"··· {current_history_type} ···",
                         }
                     ],
                 },
                 {
                     "component": "div",
-                    "props": {
-                        "class": "flex flex-row flex-wrap gap-4 items-start justify-center",
-                        "style": "margin: 0 auto; max-width: 100%;",
-                    },
+                    "props": HISTORYS_POSTS_PROPS,
                     "content": posts_content,
                 },
             ],
@@ -1863,67 +2165,25 @@ class GetMissingEpisodes(_PluginBase):
 
         return component
 
-    @staticmethod
-    def __get_svg_content(color: str, ds: List[str]):
-        def __get_path_content(fill: str, d: str) -> dict[str, Any]:
-            return {
-                "component": "path",
-                "props": {"fill": fill, "d": d},
-            }
-
-        path_content = [__get_path_content(color, d) for d in ds]
-        component = {
-            "component": "svg",
-            "props": {
-                "class": "icon",
-                "viewBox": "0 0 1024 1024",
-                "width": "40",
-                "height": "40",
-            },
-            "content": path_content,
-        }
-        return component
-
     @staticmethod
     def __get_icon_content():
-        color = "#8a8a8a"
-        icon_content = {}
-        for icon_name in Icons:
-            paths = SVGPaths.get_paths(icon_name)
-            if paths:
-                icon_content[icon_name] = GetMissingEpisodes.__get_svg_content(color, paths)
-        return icon_content
+        return {
+            icon_name: ICON_SVG_CACHE[(icon_name, ICON_COLOR)]
+            for icon_name in Icons
+            if ICON_SVG_CACHE[(icon_name, ICON_COLOR)]["content"]
+        }
 
     @staticmethod
     def __get_historys_statistic_content(
-        title: str, value: str, icon_name: Icons, history_type: str, current_history_type: str
+        title: str, value: str, icon_name: Icons, history_type: str, current_history_type: str, apikey: str
     ) -> dict[str, Any]:
         # 根据是否选中来设置卡片样式和图标颜色
         is_selected = current_history_type == history_type
         card_color = "primary" if is_selected else "tonal"
-        icon_color = "#1976d2" if is_selected else "#8a8a8a"
-        
-        # 获取图标路径
-        paths = SVGPaths.get_paths(icon_name)
-        
-        # 创建SVG图标
-        svg_content = {
-            "component": "svg",
-            "props": {
-                "class": "icon",
-                "viewBox": "0 0 1024 1024",
-                "width": "40",
-                "height": "40",
-            },
-            "content": []
-        }
+        icon_color = ICON_SELECTED_COLOR if is_selected else ICON_COLOR
         
-        # 添加路径
-        for path in paths:
-            svg_content["content"].append({
-                "component": "path",
-                "props": {"fill": icon_color, "d": path},
-            })
+        # 复用加载时生成的SVG图标
+        svg_content = ICON_SVG_CACHE[(icon_name, icon_color)]
         
         total_elements = {
             "component": "VCard",
@@ -1934,11 +2194,10 @@ class GetMissingEpisodes(_PluginBase):
             },
             "events": {
                 "click": {
-                    "api": "plugin/GetMissingEpisodes/set_history_type",
-                    "method": "get",
+                    **STAT_CARD_CLICK_TEMPLATE,
                     "params": {
                         "history_type": history_type,
-                        "apikey": settings.API_TOKEN,
+                        "apikey": apikey,
                     },
                 }
             },
@@ -1959,7 +2218,7 @@ class GetMissingEpisodes(_PluginBase):
                                 {
                                     "component": "span",
                                     "props": {"class": "text-caption"},
-                                    "text": f"{title}",
+                                    "text": title,
                                 },
                                 {
                                     "component": "div",
@@ -1970,7 +2229,7 @@ class GetMissingEpisodes(_PluginBase):
                                         {
                                             "component": "span",
                                             "props": {"class": "text-h6"},
-                                            "text": f"{value}",
+                                            "text": value,
                                         }
                                     ],
                                 },
@@ -1992,82 +2251,34 @@ class GetMissingEpisodes(_PluginBase):
         history_not_all_no_exist_total,
         historys_skipped_total,
         historys_finished_total,
+        current_history_type: str,
     ):
-        # 从数据中获取当前选中的历史数据类型
-        saved_history_type = self.get_data("current_history_type")
-        if saved_history_type:
-            self._current_history_type = saved_history_type
-
-        # 数据统计，每个统计项对应一个历史数据类型
-        data_statistics = [
-            {
-                "title": "最近处理",
-                "value": f"{min(historys_total, 10)}部",
-                "icon_name": Icons.RECENT,
-                "history_type": HistoryDataType.LATEST.value,
-            },
-            {
-                "title": "总处理",
-                "value": f"{historys_total}部",
-                "icon_name": Icons.STATISTICS,
-                "history_type": HistoryDataType.ALL.value,
-            },
-            {
-                "title": "存在缺失",
-                "value": f"{historys_no_exist_total}部",
-                "icon_name": Icons.WARNING,
-                "history_type": HistoryDataType.NO_EXIST.value,
-            },
-            {
-                "title": "已有季缺失",
-                "value": f"{history_not_all_no_exist_total}部",
-                "icon_name": Icons.TARGET,
-                "history_type": HistoryDataType.NOT_ALL_NO_EXIST.value,
-            },
-            {
-                "title": "未识别",
-                "value": f"{historys_fail_total}部",
-                "icon_name": Icons.BUG_REMOVE,
-                "history_type": HistoryDataType.FAILED.value,
-            },
-            {
-                "title": "全部存在",
-                "value": f"{historys_all_exist_total}部",
-                "icon_name": Icons.GLASSES,
-                "history_type": HistoryDataType.ALL_EXIST.value,
-            },
-            {
-                "title": "已订阅",
-                "value": f"{historys_added_rss_total}部",
-                "icon_name": Icons.ADD_SCHEDULE,
-                "history_type": HistoryDataType.ADDED_RSS.value,
-            },
-            {
-                "title": "已跳过",
-                "value": f"{historys_skipped_total}部",
-                "icon_name": Icons.SKIP,
-                "history_type": HistoryDataType.SKIPPED.value,
-            },
-            {
-                "title": "已完结",
-                "value": f"{historys_finished_total}部",
-                "icon_name": Icons.FINISHED,
-                "history_type": HistoryDataType.FINISHED.value,
-            },
-        ]
+        # 各统计项的数量，顺序与 STAT_CARDS 一致
+        totals = (
+            min(historys_total, 10),
+            historys_total,
+            historys_no_exist_total,
+            history_not_all_no_exist_total,
+            historys_fail_total,
+            historys_all_exist_total,
+            historys_added_rss_total,
+            historys_skipped_total,
+            historys_finished_total,
+        )
 
-        content = list(
-            map(
-                lambda s: GetMissingEpisodes.__get_historys_statistic_content(
-                    title=str(s["title"]),
-                    value=str(s["value"]),
-                    icon_name=Icons(s["icon_name"]),
-                    history_type=str(s["history_type"]),
-                    current_history_type=self._current_history_type,
-                ),
-                data_statistics,
+        apikey = settings.API_TOKEN
+        build_card = self.__get_historys_statistic_content
+        content = [
+            build_card(
+                title=title,
+                value=f"{total}部",
+                icon_name=icon_name,
+                history_type=history_type,
+                current_history_type=current_history_type,
+                apikey=apikey,
             )
-        )
+            for (title, icon_name, history_type), total in zip(STAT_CARDS, totals)
+        ]
 
         component = {
             "component": "VRow",
@@ -2079,7 +2290,7 @@ class GetMissingEpisodes(_PluginBase):
     def get_page(self) -> List[Dict[str, Any]]:
         """拼装插件详情页面, 需要返回页面配置, 同时附带数据"""
         # 查询检查记录
-        historys = self.get_data("history")
+        historys = self.__get_history()
 
         if not historys:
             return [
@@ -2092,50 +2303,73 @@ class GetMissingEpisodes(_PluginBase):
                 }
             ]
 
-        details = historys.get("details", {})
+        # 检测过程中记录可能被并发修改，复制一份再遍历
+        with self._lock:
+            details = dict(historys.get("details", {}))
 
         def sort_by_last_status_change(history_list):
             """按最后状态变更时间排序"""
-            history_list.sort(key=lambda x: x.get("last_status_change", x.get("last_check_full", "")), reverse=True)
+            history_list.sort(key=SORT_KEY_LAST_STATUS_CHANGE, reverse=True)
 
         def sort_by_last_check(history_list):
             """按最后检查时间排序"""
-            history_list.sort(key=lambda x: x.get("last_check_full", ""), reverse=True)
-
-        history_failed: List[ExtendedHistoryDetail] = []
-        history_all_exist: List[ExtendedHistoryDetail] = []
-        history_added_rss: List[ExtendedHistoryDetail] = []
-        history_no_exist: List[ExtendedHistoryDetail] = []
-        history_all: List[ExtendedHistoryDetail] = []
-        history_skipped: List[ExtendedHistoryDetail] = []
-        history_finished: List[ExtendedHistoryDetail] = []
-
-        # 字典将exist_status映射到相应的列表
-        status_to_list = {
-            HistoryStatus.FAILED.value: history_failed,
-            HistoryStatus.ADDED_RSS.value: history_added_rss,
-            HistoryStatus.ALL_EXIST.value: history_all_exist,
-            HistoryStatus.NO_EXIST.value: history_no_exist,
-        }
+            history_list.sort(key=SORT_KEY_LAST_CHECK, reverse=True)
+
+        history_failed: List[HistoryEntry] = []
+        history_all_exist: List[HistoryEntry] = []
+        history_added_rss: List[HistoryEntry] = []
+        history_no_exist: List[HistoryEntry] = []
+        history_all: List[HistoryEntry] = []
+        history_skipped: List[HistoryEntry] = []
+        history_finished: List[HistoryEntry] = []
+        history_not_all_no_exist: List[HistoryEntry] = []
+
+        # 循环内频繁追加，预先绑定各列表的append
+        all_append = history_all.append
+        skipped_append = history_skipped.append
+        failed_append = history_failed.append
+        added_rss_append = history_added_rss.append
+        all_exist_append = history_all_exist.append
+        no_exist_append = history_no_exist.append
+        not_all_no_exist_append = history_not_all_no_exist.append
+        finished_append = history_finished.append
 
         for key, item in details.items():
-            item_with_key = item.copy()
-            item_with_key["unique"] = key
-            history_all.append(item_with_key)
+            # 排序键在分类时计算一次，排序时直接取用
+            last_check_full = item.get("last_check_full", "")
+            entry = (key, item, last_check_full, item.get("last_status_change", last_check_full))
+            all_append(entry)
 
             # 根据skip状态分类
             if item.get("skip", False):
-                history_skipped.append(item_with_key)
+                skipped_append(entry)
 
             # 根据exist_status分类项目
-            target_list = status_to_list.get(item["exist_status"])
-            if target_list is not None:
-                target_list.append(item_with_key)
-            
-            # 根据剧集状态分类（新增：已完结）
+            exist_status = item["exist_status"]
+            if exist_status == HISTORY_STATUS_NO_EXIST:
+                no_exist_append(entry)
+            elif exist_status == HISTORY_STATUS_ALL_EXIST:
+                all_exist_append(entry)
+            elif exist_status == HISTORY_STATUS_ADDED_RSS:
+                added_rss_append(entry)
+            elif exist_status == HISTORY_STATUS_FAILED:
+                failed_append(entry)
+
             tv_info = item.get("tv_no_exist_info")
-            if tv_info and tv_info.get("status_cn") == "已完结":
-                history_finished.append(item_with_key)
+            if not tv_info:
+                continue
+
+            # 已有季缺失：存在缺失且至少一季有具体的缺失集
+            if exist_status == HISTORY_STATUS_NO_EXIST:
+                season_infos = tv_info.get("season_episode_no_exist_info")
+                if season_infos and any(
+                    season_info.get("episode_no_exist") for season_info in season_infos.values()
+                ):
+                    not_all_no_exist_append(entry)
+
+            # 根据剧集状态分类（新增：已完结）
+            if tv_info.get("status_cn") == "已完结":
+                finished_append(entry)
 
         # 对"最近处理"列表使用状态变更时间排序，其他列表使用检查时间排序
         sort_by_last_status_change(history_all)
@@ -2146,53 +2380,37 @@ class GetMissingEpisodes(_PluginBase):
         sort_by_last_check(history_skipped)
         sort_by_last_check(history_finished)
 
-        # 从数据中获取当前选中的历史数据类型
+        # 对"已有季缺失"列表按状态变更时间排序，同一时间按检查时间排序
+        sort_by_last_check(history_not_all_no_exist)
+        sort_by_last_status_change(history_not_all_no_exist)
+
+        # 从数据中获取当前选中的历史数据类型，列表选择、统计和标题共用这一个值
         saved_history_type = self.get_data("current_history_type")
         if saved_history_type:
             self._current_history_type = saved_history_type
+        current_history_type = self._current_history_type
 
-        # 根据当前选中的历史数据类型确定使用的列表
-        history_type_to_list = {
-            HistoryDataType.FAILED.value: history_failed,
-            HistoryDataType.ADDED_RSS.value: history_added_rss,
-            HistoryDataType.ALL_EXIST.value: history_all_exist,
-            HistoryDataType.NO_EXIST.value: history_no_exist,
-            HistoryDataType.SKIPPED.value: history_skipped,
-            HistoryDataType.ALL.value: history_all,
-            HistoryDataType.LATEST.value: history_all[:10],
-            HistoryDataType.FINISHED.value: history_finished,
-        }
-
-        def __get_season_episode_no_exist_info(_history: ExtendedHistoryDetail):
-            _tv_no_exist_info = _history.get("tv_no_exist_info")
-            if not _tv_no_exist_info:
-                return []
-            _no_exist_info = _tv_no_exist_info.get("season_episode_no_exist_info")
-            if not _no_exist_info:
-                return []
-
-            _values = _no_exist_info.values()
-            return _values
-
-        history_not_all_no_exist = [
-            history
-            for history in history_no_exist
-            if any(
-                season_info.get("episode_no_exist")
-                for season_info in __get_season_episode_no_exist_info(history)
-            )
-        ]
-        # 对"已有季缺失"列表按状态变更时间排序
-        sort_by_last_status_change(history_not_all_no_exist)
-
-        if self._current_history_type == HistoryDataType.NOT_ALL_NO_EXIST.value:
+        # 根据当前选中的历史数据类型确定使用的列表，未知类型按最近记录处理
+        if current_history_type == HistoryDataType.NOT_ALL_NO_EXIST.value:
             historys_in_type = history_not_all_no_exist
+        elif current_history_type == HistoryDataType.FAILED.value:
+            historys_in_type = history_failed
+        elif current_history_type == HistoryDataType.ADDED_RSS.value:
+            historys_in_type = history_added_rss
+        elif current_history_type == HistoryDataType.ALL_EXIST.value:
+            historys_in_type = history_all_exist
+        elif current_history_type == HistoryDataType.NO_EXIST.value:
+            historys_in_type = history_no_exist
+        elif current_history_type == HistoryDataType.SKIPPED.value:
+            historys_in_type = history_skipped
+        elif current_history_type == HistoryDataType.ALL.value:
+            historys_in_type = history_all
+        elif current_history_type == HistoryDataType.FINISHED.value:
+            historys_in_type = history_finished
         else:
-            historys_in_type = history_type_to_list.get(
-                self._current_history_type, history_all[:10]
-            )
+            historys_in_type = history_all[:10]
 
-        historys_posts_content = self.__get_historys_posts_content(historys_in_type)
+        historys_posts_content = self.__get_historys_posts_content(historys_in_type, current_history_type)
 
         # 统计数据
         historys_total = len(history_all)
@@ -2213,6 +2431,7 @@ class GetMissingEpisodes(_PluginBase):
             history_not_all_no_exist_total=history_not_all_no_exist_total,
             historys_skipped_total=historys_skipped_total,
             historys_finished_total=historys_finished_total,
+            current_history_type=current_history_type,
         )
 
         # 拼装页面